@@ -13,6 +13,25 @@ import json
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Order of sklearn's binary confusion_matrix(...).ravel()
+CONFUSION_MATRIX_KEYS = ('tn', 'fp', 'fn', 'tp')
+
+_INT8_RANGE = np.iinfo(np.int8)
+
+
+def _as_label_array(labels) -> np.ndarray:
+    """
+    Class labels as an ndarray, narrowed to int8 when every value fits
+
+    Labels that are not integers (e.g. class-name strings) or fall outside
+    the int8 range keep their original dtype.
+    """
+    labels = np.asarray(labels)
+    if labels.dtype.kind in 'iu' and labels.size > 0 and \
+            _INT8_RANGE.min <= labels.min() and labels.max() <= _INT8_RANGE.max:
+        return labels.astype(np.int8, copy=False)
+    return labels
+
 
 class ClinicalValidator:
     """Clinical validation framework for medical AI models"""
@@ -40,15 +59,21 @@ class ClinicalValidator:
         Returns:
             Validation metrics
         """
-        predictions = np.array(predictions)
-        ground_truth = np.array(ground_truth)
+        # Narrow integer labels cut the memory traffic of the metric
+        # computations below; narrowing copies unless the input is already int8
+        predictions = _as_label_array(predictions)
+        ground_truth = _as_label_array(ground_truth)
+        if probabilities is not None:
+            probabilities = np.asarray(probabilities, dtype=np.float32)
 
         # Confusion matrix
         cm = confusion_matrix(ground_truth, predictions)
 
         # Binary classification metrics
         if len(np.unique(ground_truth)) == 2:
-            tn, fp, fn, tp = cm.ravel()
+            # tolist() unboxes all four counts in a single call
+            counts = cm.ravel().tolist()
+            tn, fp, fn, tp = counts
 
             sensitivity = tp / (tp + fn) if (tp + fn) > 0 else 0.0
             specificity = tn / (tn + fp) if (tn + fp) > 0 else 0.0
@@ -75,10 +100,7 @@ class ClinicalValidator:
                 'npv': float(npv),
                 'f1_score': float(f1),
                 'auc_roc': float(auc_roc) if auc_roc is not None else None,
-                'confusion_matrix': {
-                    'tn': int(tn), 'fp': int(fp),
-                    'fn': int(fn), 'tp': int(tp)
-                }
+                'confusion_matrix': dict(zip(CONFUSION_MATRIX_KEYS, counts))
             }
         else:
             # Multi-class metrics
@@ -136,6 +158,15 @@ class ClinicalValidator:
 
     def _calculate_dice(self, pred: np.ndarray, gt: np.ndarray) -> float:
         """Calculate Dice coefficient"""
+        # Empty masks are common in sparse lesion data; any() stops at the
+        # first non-zero element, so skip the full reductions when possible
+        pred_any = pred.any()
+        gt_any = gt.any()
+        if not pred_any and not gt_any:
+            return 1.0
+        if not pred_any or not gt_any:
+            return 0.0
+
         intersection = np.sum(pred * gt)
         union = np.sum(pred) + np.sum(gt)
 
@@ -147,6 +178,13 @@ class ClinicalValidator:
 
     def _calculate_iou(self, pred: np.ndarray, gt: np.ndarray) -> float:
         """Calculate Intersection over Union (IoU)"""
+        pred_any = pred.any()
+        gt_any = gt.any()
+        if not pred_any and not gt_any:
+            return 1.0
+        if not pred_any or not gt_any:
+            return 0.0
+
         intersection = np.sum(pred * gt)
         union = np.sum((pred + gt) > 0)
 
@@ -3,7 +3,7 @@ HIPAA Compliance Monitor
 Automated compliance checking, anomaly detection, and breach notification
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from typing import List, Dict, Optional
@@ -11,6 +11,7 @@ import uvicorn
 import logging
 from datetime import datetime, timedelta
 import numpy as np
+import ijson
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -21,6 +22,11 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# Hours outside the 8am-6pm window, indexed by timestamp.hour
+BAD_HOUR_LUT = np.zeros(24, dtype=bool)
+BAD_HOUR_LUT[:8] = True
+BAD_HOUR_LUT[19:] = True
+
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_credentials=True, allow_methods=["*"], allow_headers=["*"])
 
 # Pydantic models
@@ -43,7 +49,7 @@ async def root():
         "service": "HIPAA Compliance Monitor",
         "version": "1.0.0",
         "status": "operational",
-        "endpoints": ["/health", "/compliance/check", "/detect/anomalies", "/audit/report"]
+        "endpoints": ["/health", "/compliance/check", "/detect/anomalies", "/detect/anomalies/stream", "/audit/report"]
     }
 
 @app.get("/health")
@@ -126,16 +132,16 @@ async def detect_anomalies(access_logs: List[AccessLogEntry]):
 
         for user_id, logs in user_logs.items():
             # Check access time
-            for log in logs:
-                hour = log.timestamp.hour
-                if hour < 8 or hour > 18:
-                    anomalies.append({
-                        "type": "unusual_access_time",
-                        "severity": "medium",
-                        "user_id": user_id,
-                        "details": f"Access at {log.timestamp.strftime('%I:%M %p')} (outside 8am-6pm)",
-                        "timestamp": log.timestamp.isoformat()
-                    })
+            hours = np.fromiter((log.timestamp.hour for log in logs), dtype=np.intp, count=len(logs))
+            for idx in np.nonzero(BAD_HOUR_LUT[hours])[0]:
+                log = logs[idx]
+                anomalies.append({
+                    "type": "unusual_access_time",
+                    "severity": "medium",
+                    "user_id": user_id,
+                    "details": f"Access at {log.timestamp.strftime('%I:%M %p')} (outside 8am-6pm)",
+                    "timestamp": log.timestamp.isoformat()
+                })
 
             # Check volume
             if len(logs) > 50:
@@ -158,33 +164,91 @@ async def detect_anomalies(access_logs: List[AccessLogEntry]):
                     "timestamp": datetime.utcnow().isoformat()
                 })
 
-        # Risk assessment
-        critical_count = sum(1 for a in anomalies if a['severity'] == 'critical')
-        if critical_count > 0:
-            risk_level = "critical"
-            action = "Immediate investigation required. Potential security breach."
-        elif len(anomalies) > 10:
-            risk_level = "high"
-            action = "Urgent review recommended within 24 hours."
-        elif len(anomalies) > 0:
-            risk_level = "medium"
-            action = "Review during next security audit."
-        else:
-            risk_level = "low"
-            action = "No immediate action required."
-
-        return {
-            "anomalies_detected": len(anomalies),
-            "risk_level": risk_level,
-            "recommended_action": action,
-            "anomalies": anomalies,
-            "timestamp": datetime.utcnow().isoformat()
-        }
+        return _anomaly_response(anomalies)
 
     except Exception as e:
         logger.error(f"Anomaly detection error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/detect/anomalies/stream")
+async def detect_anomalies_stream(request: Request):
+    """
+    Streaming variant of /detect/anomalies for large access-log uploads
+
+    Accepts the same JSON array body, but parses it incrementally as chunks
+    arrive and keeps only per-user counters, so memory stays constant in the
+    number of log entries instead of buffering the whole payload.
+    """
+    try:
+        # user_id -> [access_count, failed_count, unusual_time_anomalies]
+        user_stats = {}
+
+        records = ijson.sendable_list()
+        parser = ijson.items_coro(records, "item")
+
+        def tally_parsed_records():
+            """Fold the records parsed so far into user_stats and drop them"""
+            for record in records:
+                log = AccessLogEntry.model_validate(record)
+                stats = user_stats.get(log.user_id)
+                if stats is None:
+                    stats = user_stats[log.user_id] = [0, 0, []]
+                stats[0] += 1
+                if not log.success:
+                    stats[1] += 1
+                if BAD_HOUR_LUT[log.timestamp.hour]:
+                    stats[2].append({
+                        "type": "unusual_access_time",
+                        "severity": "medium",
+                        "user_id": log.user_id,
+                        "details": f"Access at {log.timestamp.strftime('%I:%M %p')} (outside 8am-6pm)",
+                        "timestamp": log.timestamp.isoformat()
+                    })
+            del records[:]
+
+        async for chunk in request.stream():
+            # The stream ends with an empty chunk, which the parser would take
+            # as end of input; close() below ends it instead
+            if chunk:
+                parser.send(chunk)
+                tally_parsed_records()
+
+        # The parser can hold back the last item until end of input
+        parser.close()
+        tally_parsed_records()
+
+        anomalies = []
+        for user_id, (access_count, failed_count, time_anomalies) in user_stats.items():
+            anomalies.extend(time_anomalies)
+
+            if access_count > 50:
+                anomalies.append({
+                    "type": "high_volume_access",
+                    "severity": "high",
+                    "user_id": user_id,
+                    "details": f"Accessed {access_count} patients in time period",
+                    "timestamp": datetime.utcnow().isoformat()
+                })
+
+            if failed_count > 5:
+                anomalies.append({
+                    "type": "multiple_failed_attempts",
+                    "severity": "critical",
+                    "user_id": user_id,
+                    "details": f"{failed_count} failed access attempts",
+                    "timestamp": datetime.utcnow().isoformat()
+                })
+
+        return _anomaly_response(anomalies)
+
+    except ijson.JSONError as e:
+        raise HTTPException(status_code=400, detail=f"Malformed access log stream: {str(e)}")
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        logger.error(f"Streaming anomaly detection error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.get("/audit/report")
 async def generate_audit_report():
     """Generate HIPAA compliance audit report"""
@@ -225,67 +289,72 @@ async def generate_audit_report():
 
     return report
 
-def _check_technical_safeguards(details: Dict) -> Dict:
-    """Check technical safeguards compliance"""
-    checks = []
-
-    # Access Control (§164.312(a))
-    checks.append({
-        "regulation": "§164.312(a)(1)",
-        "requirement": "Unique User Identification",
-        "status": "pass" if details.get("unique_user_ids") else "fail"
-    })
-
-    checks.append({
-        "regulation": "§164.312(a)(2)(i)",
-        "requirement": "Emergency Access Procedure",
-        "status": "pass" if details.get("emergency_access") else "fail"
-    })
-
-    # Audit Controls (§164.312(b))
-    checks.append({
-        "regulation": "§164.312(b)",
-        "requirement": "Audit Controls",
-        "status": "pass" if details.get("audit_logging") else "fail"
-    })
-
-    # Integrity Controls (§164.312(c)(1))
-    checks.append({
-        "regulation": "§164.312(c)(1)",
-        "requirement": "Integrity Controls",
-        "status": "pass" if details.get("integrity_checks") else "fail"
-    })
-
-    # Transmission Security (§164.312(e)(1))
-    checks.append({
-        "regulation": "§164.312(e)(1)",
-        "requirement": "Transmission Security (TLS/SSL)",
-        "status": "pass" if details.get("encryption_in_transit") else "fail"
-    })
+# (regulation, requirement, details key) for each safeguard category
+TECHNICAL_CHECKS = (
+    ("§164.312(a)(1)", "Unique User Identification", "unique_user_ids"),
+    ("§164.312(a)(2)(i)", "Emergency Access Procedure", "emergency_access"),
+    ("§164.312(b)", "Audit Controls", "audit_logging"),
+    ("§164.312(c)(1)", "Integrity Controls", "integrity_checks"),
+    ("§164.312(e)(1)", "Transmission Security (TLS/SSL)", "encryption_in_transit"),
+)
 
-    recommendations = [c['requirement'] for c in checks if c['status'] == 'fail']
+PHYSICAL_CHECKS = (
+    ("§164.310(a)(1)", "Facility Security Plan", "facility_plan"),
+    ("§164.310(b)", "Workstation Use Policy", "workstation_policy"),
+    ("§164.310(d)(1)", "Device and Media Controls", "device_controls"),
+)
 
-    return {"checks": checks, "recommendations": recommendations}
+ADMINISTRATIVE_CHECKS = (
+    ("§164.308(a)(1)(i)", "Security Management Process", "security_mgmt"),
+    ("§164.308(a)(3)(i)", "Workforce Security", "workforce_security"),
+    ("§164.308(a)(5)(i)", "Security Awareness Training", "security_training"),
+)
 
-def _check_physical_safeguards(details: Dict) -> Dict:
-    """Check physical safeguards compliance"""
+def _run_checks(spec: tuple, details: Dict) -> Dict:
+    """Evaluate a safeguard check table against the submitted details"""
     checks = [
-        {"regulation": "§164.310(a)(1)", "requirement": "Facility Security Plan", "status": "pass" if details.get("facility_plan") else "fail"},
-        {"regulation": "§164.310(b)", "requirement": "Workstation Use Policy", "status": "pass" if details.get("workstation_policy") else "fail"},
-        {"regulation": "§164.310(d)(1)", "requirement": "Device and Media Controls", "status": "pass" if details.get("device_controls") else "fail"}
+        {"regulation": reg, "requirement": req, "status": "pass" if details.get(key) else "fail"}
+        for reg, req, key in spec
     ]
     recommendations = [c['requirement'] for c in checks if c['status'] == 'fail']
     return {"checks": checks, "recommendations": recommendations}
 
+def _check_technical_safeguards(details: Dict) -> Dict:
+    """Check technical safeguards compliance"""
+    return _run_checks(TECHNICAL_CHECKS, details)
+
+def _check_physical_safeguards(details: Dict) -> Dict:
+    """Check physical safeguards compliance"""
+    return _run_checks(PHYSICAL_CHECKS, details)
+
 def _check_administrative_safeguards(details: Dict) -> Dict:
     """Check administrative safeguards compliance"""
-    checks = [
-        {"regulation": "§164.308(a)(1)(i)", "requirement": "Security Management Process", "status": "pass" if details.get("security_mgmt") else "fail"},
-        {"regulation": "§164.308(a)(3)(i)", "requirement": "Workforce Security", "status": "pass" if details.get("workforce_security") else "fail"},
-        {"regulation": "§164.308(a)(5)(i)", "requirement": "Security Awareness Training", "status": "pass" if details.get("security_training") else "fail"}
-    ]
-    recommendations = [c['requirement'] for c in checks if c['status'] == 'fail']
-    return {"checks": checks, "recommendations": recommendations}
+    return _run_checks(ADMINISTRATIVE_CHECKS, details)
+
+def _anomaly_response(anomalies: List[Dict]) -> Dict:
+    """Assess overall risk for a list of detected anomalies"""
+    # Risk assessment
+    critical_count = sum(1 for a in anomalies if a['severity'] == 'critical')
+    if critical_count > 0:
+        risk_level = "critical"
+        action = "Immediate investigation required. Potential security breach."
+    elif len(anomalies) > 10:
+        risk_level = "high"
+        action = "Urgent review recommended within 24 hours."
+    elif len(anomalies) > 0:
+        risk_level = "medium"
+        action = "Review during next security audit."
+    else:
+        risk_level = "low"
+        action = "No immediate action required."
+
+    return {
+        "anomalies_detected": len(anomalies),
+        "risk_level": risk_level,
+        "recommended_action": action,
+        "anomalies": anomalies,
+        "timestamp": datetime.utcnow().isoformat()
+    }
 
 if __name__ == "__main__":
     import argparse
@@ -5,13 +5,879 @@ Comprehensive audit of all HIPAA Security Rule requirements (45 CFR § 164.302-3
 
 import json
 import logging
-from typing import Dict, List
+import sys
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Tuple
 from datetime import datetime
-import os
 
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
 logger = logging.getLogger(__name__)
 
+_RULE = "=" * 70
+_AUDIT_BANNER = "\n".join([
+    _RULE,
+    "HIPAA SECURITY RULE COMPLIANCE AUDIT",
+    "Organization: %s",
+    "Date: %s",
+    _RULE
+])
+
+
+@lru_cache(maxsize=2)
+def _now_iso(second: int) -> str:
+    """ISO-8601 local time for a Unix second; call as _now_iso(int(time.time()))"""
+    return datetime.fromtimestamp(second).isoformat()
+
+
+@dataclass(frozen=True, slots=True)
+class Check:
+    """A single HIPAA Security Rule checklist entry"""
+    regulation: str
+    requirement: str
+    implementation: str
+    questions: Tuple[str, ...]
+    evidence_required: Tuple[str, ...] = ()
+
+    # Keys a check exposes through dict-style access, as in as_dict()
+    _KEYS = frozenset(('regulation', 'requirement', 'implementation', 'questions', 'evidence_required'))
+
+    def __getitem__(self, key: str):
+        """Dict-style access (check['regulation']) for callers written against check dicts"""
+        if key in self:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        # Like as_dict(), which has no 'evidence_required' when there is none
+        return key in self._KEYS and (key != 'evidence_required' or bool(self.evidence_required))
+
+    def get(self, key: str, default=None):
+        return self[key] if key in self else default
+
+    @classmethod
+    def coerce(cls, check) -> 'Check':
+        """Check record for a check given as a Check or as a checklist dict"""
+        if isinstance(check, cls):
+            return check
+        return cls(
+            regulation=check['regulation'],
+            requirement=check['requirement'],
+            implementation=check.get('implementation', ''),
+            questions=tuple(check.get('questions', ())),
+            evidence_required=tuple(check.get('evidence_required', ()))
+        )
+
+    def as_dict(self) -> Dict:
+        """JSON-ready dict; evidence_required is omitted when there is none"""
+        check = {
+            'regulation': self.regulation,
+            'requirement': self.requirement,
+            'implementation': self.implementation,
+            'questions': list(self.questions)
+        }
+        if self.evidence_required:
+            check['evidence_required'] = list(self.evidence_required)
+        return check
+
+
+# Flyweight pool of frozen question/evidence lists: identical lists across
+# checks share one canonical tuple
+_TUPLE_POOL: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def _freeze_value(value):
+    """Intern strings; sub-lists become pooled tuples of interned strings"""
+    if isinstance(value, list):
+        frozen = tuple(sys.intern(item) for item in value)
+        return _TUPLE_POOL.setdefault(frozen, frozen)
+    return sys.intern(value)
+
+
+def _freeze_checks(checks: List[Dict]) -> Tuple[Check, ...]:
+    """
+    Freeze a checklist into immutable Check records
+
+    All strings are interned so repeated values ('Required', 'Addressable',
+    shared questions) are one object and compare by identity first.
+    """
+    return tuple(
+        Check(**{key: _freeze_value(value) for key, value in check.items()})
+        for check in checks
+    )
+
+
+# HIPAA Security Rule checklists, built once at import and shared by every
+# audit. Entries are frozen Check records; reports carry them as plain dicts.
+ADMINISTRATIVE_SAFEGUARD_CHECKS = _freeze_checks([
+    # §164.308(a)(1) - Security Management Process
+    {
+        'regulation': '§164.308(a)(1)(i)',
+        'requirement': 'Security Management Process',
+        'implementation': 'Required',
+        'questions': [
+            'Risk analysis conducted and documented?',
+            'Risk management strategy implemented?',
+            'Sanction policy for violations?',
+            'Information system activity review process?'
+        ],
+        'evidence_required': [
+            'Risk analysis documentation',
+            'Risk management plan',
+            'Sanctions policy',
+            'Audit logs review procedures'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(1)(ii)(A)',
+        'requirement': 'Risk Analysis',
+        'implementation': 'Required',
+        'questions': [
+            'Potential risks to ePHI identified?',
+            'Likelihood and impact assessed?',
+            'Current security measures evaluated?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(1)(ii)(B)',
+        'requirement': 'Risk Management',
+        'implementation': 'Required',
+        'questions': [
+            'Security measures implemented to reduce risks?',
+            'Risks reduced to reasonable and appropriate level?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(1)(ii)(C)',
+        'requirement': 'Sanction Policy',
+        'implementation': 'Required',
+        'questions': [
+            'Sanctions applied to workforce members who violate policies?',
+            'Sanction policy documented and communicated?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(1)(ii)(D)',
+        'requirement': 'Information System Activity Review',
+        'implementation': 'Required',
+        'questions': [
+            'Information system activity regularly reviewed?',
+            'Audit logs, access reports, security incidents reviewed?'
+        ]
+    },
+
+    # §164.308(a)(2) - Assigned Security Responsibility
+    {
+        'regulation': '§164.308(a)(2)',
+        'requirement': 'Assigned Security Responsibility',
+        'implementation': 'Required',
+        'questions': [
+            'Security official designated?',
+            'Security responsibilities clearly defined?'
+        ],
+        'evidence_required': ['Security officer designation document']
+    },
+
+    # §164.308(a)(3) - Workforce Security
+    {
+        'regulation': '§164.308(a)(3)(i)',
+        'requirement': 'Workforce Security',
+        'implementation': 'Required',
+        'questions': [
+            'Procedures for workforce member authorization?',
+            'Workforce clearance procedures?',
+            'Termination procedures?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(3)(ii)(A)',
+        'requirement': 'Authorization and/or Supervision',
+        'implementation': 'Addressable',
+        'questions': [
+            'Authorization procedures for workforce access to ePHI?',
+            'Supervision of workforce members?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(3)(ii)(B)',
+        'requirement': 'Workforce Clearance Procedure',
+        'implementation': 'Addressable',
+        'questions': [
+            'Clearance procedures appropriate to access level?',
+            'Background checks conducted?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(3)(ii)(C)',
+        'requirement': 'Termination Procedures',
+        'implementation': 'Addressable',
+        'questions': [
+            'Procedures for terminating access?',
+            'Access terminated within 24 hours of termination?'
+        ]
+    },
+
+    # §164.308(a)(4) - Information Access Management
+    {
+        'regulation': '§164.308(a)(4)(i)',
+        'requirement': 'Information Access Management',
+        'implementation': 'Required',
+        'questions': [
+            'Policies for authorizing access to ePHI?',
+            'Access limited to minimum necessary?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(4)(ii)(B)',
+        'requirement': 'Access Authorization',
+        'implementation': 'Addressable',
+        'questions': [
+            'Access authorization policies and procedures?',
+            'Role-based access control implemented?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(4)(ii)(C)',
+        'requirement': 'Access Establishment and Modification',
+        'implementation': 'Addressable',
+        'questions': [
+            'Procedures for granting access?',
+            'Procedures for modifying access?',
+            'Access reviewed periodically?'
+        ]
+    },
+
+    # §164.308(a)(5) - Security Awareness and Training
+    {
+        'regulation': '§164.308(a)(5)(i)',
+        'requirement': 'Security Awareness and Training',
+        'implementation': 'Required',
+        'questions': [
+            'Security awareness training program implemented?',
+            'All workforce members trained?',
+            'Annual refresher training provided?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(5)(ii)(A)',
+        'requirement': 'Security Reminders',
+        'implementation': 'Addressable',
+        'questions': [
+            'Periodic security reminders provided?',
+            'Phishing awareness training?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(5)(ii)(B)',
+        'requirement': 'Protection from Malicious Software',
+        'implementation': 'Addressable',
+        'questions': [
+            'Training on malware threats?',
+            'Antivirus/anti-malware deployed?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(5)(ii)(C)',
+        'requirement': 'Log-in Monitoring',
+        'implementation': 'Addressable',
+        'questions': [
+            'Login attempts monitored?',
+            'Unusual login activity reported?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(5)(ii)(D)',
+        'requirement': 'Password Management',
+        'implementation': 'Addressable',
+        'questions': [
+            'Password policies established?',
+            'Complex passwords required (8+ chars, uppercase, lowercase, numbers, special)?',
+            'Password rotation enforced (every 90 days)?',
+            'Previous passwords prevented from reuse?'
+        ]
+    },
+
+    # §164.308(a)(6) - Security Incident Procedures
+    {
+        'regulation': '§164.308(a)(6)(i)',
+        'requirement': 'Security Incident Procedures',
+        'implementation': 'Required',
+        'questions': [
+            'Procedures for identifying security incidents?',
+            'Procedures for responding to incidents?',
+            'Procedures for mitigating harmful effects?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(6)(ii)',
+        'requirement': 'Response and Reporting',
+        'implementation': 'Required',
+        'questions': [
+            'Incident response plan documented?',
+            'Incidents tracked and documented?',
+            'Breaches reported per §164.404-414?'
+        ]
+    },
+
+    # §164.308(a)(7) - Contingency Plan
+    {
+        'regulation': '§164.308(a)(7)(i)',
+        'requirement': 'Contingency Plan',
+        'implementation': 'Required',
+        'questions': [
+            'Data backup plan established?',
+            'Disaster recovery plan documented?',
+            'Emergency mode operation plan?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(7)(ii)(A)',
+        'requirement': 'Data Backup Plan',
+        'implementation': 'Required',
+        'questions': [
+            'ePHI backed up regularly?',
+            'Backups tested for restore?',
+            'Backups stored securely offsite?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(7)(ii)(B)',
+        'requirement': 'Disaster Recovery Plan',
+        'implementation': 'Required',
+        'questions': [
+            'Disaster recovery procedures established?',
+            'RTO (Recovery Time Objective) defined?',
+            'RPO (Recovery Point Objective) defined?',
+            'Plan tested annually?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(7)(ii)(C)',
+        'requirement': 'Emergency Mode Operation Plan',
+        'implementation': 'Required',
+        'questions': [
+            'Emergency operations procedures established?',
+            'ePHI accessible during emergencies?'
+        ]
+    },
+    {
+        'regulation': '§164.308(a)(7)(ii)(E)',
+        'requirement': 'Applications and Data Criticality Analysis',
+        'implementation': 'Addressable',
+        'questions': [
+            'Critical applications identified?',
+            'Data criticality assessed?',
+            'Priority recovery order established?'
+        ]
+    },
+
+    # §164.308(a)(8) - Evaluation
+    {
+        'regulation': '§164.308(a)(8)',
+        'requirement': 'Evaluation',
+        'implementation': 'Required',
+        'questions': [
+            'Periodic technical and non-technical evaluations conducted?',
+            'Security measures effectiveness assessed?',
+            'Evaluations conducted at least annually?',
+            'Evaluations after environmental or operational changes?'
+        ],
+        'evidence_required': ['Annual security evaluation reports']
+    },
+
+    # §164.308(b) - Business Associate Contracts
+    {
+        'regulation': '§164.308(b)(1)',
+        'requirement': 'Business Associate Contracts',
+        'implementation': 'Required',
+        'questions': [
+            'Written BAAs with all business associates?',
+            'BAAs include required provisions (§164.314)?',
+            'Subcontractor agreements in place?'
+        ],
+        'evidence_required': ['Signed Business Associate Agreements']
+    },
+])
+
+
+PHYSICAL_SAFEGUARD_CHECKS = _freeze_checks([
+    # §164.310(a) - Facility Access Controls
+    {
+        'regulation': '§164.310(a)(1)',
+        'requirement': 'Facility Access Controls',
+        'implementation': 'Required',
+        'questions': [
+            'Procedures to limit physical access to ePHI?',
+            'Authorized personnel only can access facilities?'
+        ]
+    },
+    {
+        'regulation': '§164.310(a)(2)(i)',
+        'requirement': 'Contingency Operations',
+        'implementation': 'Addressable',
+        'questions': [
+            'Facility access procedures during emergencies?'
+        ]
+    },
+    {
+        'regulation': '§164.310(a)(2)(ii)',
+        'requirement': 'Facility Security Plan',
+        'implementation': 'Addressable',
+        'questions': [
+            'Facility security plan documented?',
+            'Physical barriers (locks, badges)?',
+            'Visitor logs maintained?'
+        ]
+    },
+    {
+        'regulation': '§164.310(a)(2)(iii)',
+        'requirement': 'Access Control and Validation Procedures',
+        'implementation': 'Addressable',
+        'questions': [
+            'Procedures for controlling/validating access?',
+            'Badge access system?',
+            'Sign-in/sign-out logs?'
+        ]
+    },
+    {
+        'regulation': '§164.310(a)(2)(iv)',
+        'requirement': 'Maintenance Records',
+        'implementation': 'Addressable',
+        'questions': [
+            'Facility repairs/modifications documented?',
+            'Security impact assessed?'
+        ]
+    },
+
+    # §164.310(b) - Workstation Use
+    {
+        'regulation': '§164.310(b)',
+        'requirement': 'Workstation Use',
+        'implementation': 'Required',
+        'questions': [
+            'Policies for workstation use?',
+            'Proper use of workstations accessing ePHI defined?',
+            'Acceptable use policy documented?'
+        ]
+    },
+
+    # §164.310(c) - Workstation Security
+    {
+        'regulation': '§164.310(c)',
+        'requirement': 'Workstation Security',
+        'implementation': 'Required',
+        'questions': [
+            'Physical safeguards for workstations?',
+            'Privacy screens used?',
+            'Auto-lock after inactivity (15 min)?',
+            'Workstations positioned to minimize ePHI exposure?'
+        ]
+    },
+
+    # §164.310(d) - Device and Media Controls
+    {
+        'regulation': '§164.310(d)(1)',
+        'requirement': 'Device and Media Controls',
+        'implementation': 'Required',
+        'questions': [
+            'Policies for receipt and removal of hardware/media?',
+            'ePHI disposal procedures?',
+            'Media reuse procedures?'
+        ]
+    },
+    {
+        'regulation': '§164.310(d)(2)(i)',
+        'requirement': 'Disposal',
+        'implementation': 'Required',
+        'questions': [
+            'Procedures for final disposal of ePHI?',
+            'Secure deletion/destruction methods?',
+            'Certificate of destruction obtained?'
+        ]
+    },
+    {
+        'regulation': '§164.310(d)(2)(ii)',
+        'requirement': 'Media Re-use',
+        'implementation': 'Required',
+        'questions': [
+            'Procedures for removing ePHI before reuse?',
+            'Secure wiping procedures?'
+        ]
+    },
+    {
+        'regulation': '§164.310(d)(2)(iii)',
+        'requirement': 'Accountability',
+        'implementation': 'Addressable',
+        'questions': [
+            'Hardware/media movements tracked?',
+            'Inventory of devices maintained?'
+        ]
+    },
+    {
+        'regulation': '§164.310(d)(2)(iv)',
+        'requirement': 'Data Backup and Storage',
+        'implementation': 'Addressable',
+        'questions': [
+            'Backup media stored securely?',
+            'Offsite backup storage?',
+            'Backup media encrypted?'
+        ]
+    },
+])
+
+
+TECHNICAL_SAFEGUARD_CHECKS = _freeze_checks([
+    # §164.312(a) - Access Control
+    {
+        'regulation': '§164.312(a)(1)',
+        'requirement': 'Access Control',
+        'implementation': 'Required',
+        'questions': [
+            'Technical policies to limit ePHI access?',
+            'Access limited to authorized persons?'
+        ]
+    },
+    {
+        'regulation': '§164.312(a)(2)(i)',
+        'requirement': 'Unique User Identification',
+        'implementation': 'Required',
+        'questions': [
+            'Unique user IDs assigned?',
+            'No shared accounts?',
+            'User identification tracked in audit logs?'
+        ]
+    },
+    {
+        'regulation': '§164.312(a)(2)(ii)',
+        'requirement': 'Emergency Access Procedure',
+        'implementation': 'Required',
+        'questions': [
+            'Emergency access procedures established?',
+            'Break-glass accounts available?',
+            'Emergency access logged and reviewed?'
+        ]
+    },
+    {
+        'regulation': '§164.312(a)(2)(iii)',
+        'requirement': 'Automatic Logoff',
+        'implementation': 'Addressable',
+        'questions': [
+            'Automatic logoff after inactivity?',
+            'Timeout set to 15 minutes or less?'
+        ]
+    },
+    {
+        'regulation': '§164.312(a)(2)(iv)',
+        'requirement': 'Encryption and Decryption',
+        'implementation': 'Addressable',
+        'questions': [
+            'ePHI encrypted at rest?',
+            'Encryption algorithm (AES-256)?',
+            'ePHI encrypted in transit (TLS 1.2/1.3)?',
+            'Encryption keys managed securely?'
+        ]
+    },
+
+    # §164.312(b) - Audit Controls
+    {
+        'regulation': '§164.312(b)',
+        'requirement': 'Audit Controls',
+        'implementation': 'Required',
+        'questions': [
+            'Audit logs implemented?',
+            'All ePHI access logged?',
+            'Logs include: user ID, timestamp, action, resource?',
+            'Logs retained for 6 years?',
+            'Logs protected from modification?',
+            'Logs reviewed regularly?'
+        ],
+        'evidence_required': ['Audit log samples', 'Log review procedures']
+    },
+
+    # §164.312(c) - Integrity
+    {
+        'regulation': '§164.312(c)(1)',
+        'requirement': 'Integrity',
+        'implementation': 'Required',
+        'questions': [
+            'Policies to ensure ePHI not improperly altered/destroyed?',
+            'Data integrity controls implemented?'
+        ]
+    },
+    {
+        'regulation': '§164.312(c)(2)',
+        'requirement': 'Mechanism to Authenticate ePHI',
+        'implementation': 'Addressable',
+        'questions': [
+            'Methods to verify ePHI not altered?',
+            'Digital signatures or checksums used?',
+            'Version control implemented?'
+        ]
+    },
+
+    # §164.312(d) - Person or Entity Authentication
+    {
+        'regulation': '§164.312(d)',
+        'requirement': 'Person or Entity Authentication',
+        'implementation': 'Required',
+        'questions': [
+            'Authentication procedures implemented?',
+            'Multi-factor authentication (MFA) required?',
+            'Password complexity enforced?',
+            'Failed login attempts tracked?',
+            'Account lockout after 5 failed attempts?'
+        ]
+    },
+
+    # §164.312(e) - Transmission Security
+    {
+        'regulation': '§164.312(e)(1)',
+        'requirement': 'Transmission Security',
+        'implementation': 'Required',
+        'questions': [
+            'Technical measures to guard against unauthorized ePHI access during transmission?',
+            'Network security measures?'
+        ]
+    },
+    {
+        'regulation': '§164.312(e)(2)(i)',
+        'requirement': 'Integrity Controls',
+        'implementation': 'Addressable',
+        'questions': [
+            'Measures to ensure transmitted ePHI not improperly modified?',
+            'Message authentication codes used?'
+        ]
+    },
+    {
+        'regulation': '§164.312(e)(2)(ii)',
+        'requirement': 'Encryption',
+        'implementation': 'Addressable',
+        'questions': [
+            'ePHI encrypted during network transmission?',
+            'TLS 1.2 or higher used?',
+            'VPN for remote access?',
+            'Email encryption for ePHI?'
+        ]
+    },
+])
+
+
+ORGANIZATIONAL_REQUIREMENT_CHECKS = _freeze_checks([
+    # §164.314(a) - Business Associate Contracts
+    {
+        'regulation': '§164.314(a)(1)',
+        'requirement': 'Business Associate Contracts or Other Arrangements',
+        'implementation': 'Required',
+        'questions': [
+            'Written BAAs with all business associates?',
+            'BAAs include all required provisions?',
+            'BAAs reviewed annually?'
+        ]
+    },
+    {
+        'regulation': '§164.314(a)(2)(i)',
+        'requirement': 'BAA Required Provisions',
+        'implementation': 'Required',
+        'questions': [
+            'BAA requires BA to comply with HIPAA?',
+            'BAA requires safeguards for ePHI?',
+            'BAA requires breach reporting?',
+            'BAA requires subcontractor agreements?',
+            'BAA allows termination for violations?'
+        ]
+    },
+
+    # §164.314(b) - Other Arrangements
+    {
+        'regulation': '§164.314(b)(1)',
+        'requirement': 'Requirements for Group Health Plans',
+        'implementation': 'Required',
+        'questions': [
+            'Group health plan documents include privacy provisions?'
+        ]
+    },
+])
+
+
+POLICY_AND_PROCEDURE_CHECKS = _freeze_checks([
+    # §164.316(a) - Policies and Procedures
+    {
+        'regulation': '§164.316(a)',
+        'requirement': 'Policies and Procedures',
+        'implementation': 'Required',
+        'questions': [
+            'Written policies and procedures for all HIPAA requirements?',
+            'Policies reviewed annually?',
+            'Policies approved by management?',
+            'Policies accessible to workforce?'
+        ],
+        'evidence_required': ['Complete HIPAA policies and procedures manual']
+    },
+
+    # §164.316(b) - Documentation
+    {
+        'regulation': '§164.316(b)(1)',
+        'requirement': 'Documentation',
+        'implementation': 'Required',
+        'questions': [
+            'All required documentation maintained?',
+            'Documentation includes policies, procedures, actions, activities, assessments?',
+            'Documentation retained for 6 years?',
+            'Documentation available to workforce and for review?'
+        ]
+    },
+    {
+        'regulation': '§164.316(b)(2)(i)',
+        'requirement': 'Time Limit',
+        'implementation': 'Required',
+        'questions': [
+            'Documentation retained for 6 years from creation or last effective date?'
+        ]
+    },
+    {
+        'regulation': '§164.316(b)(2)(ii)',
+        'requirement': 'Availability',
+        'implementation': 'Required',
+        'questions': [
+            'Documentation made available to responsible parties?'
+        ]
+    },
+    {
+        'regulation': '§164.316(b)(2)(iii)',
+        'requirement': 'Updates',
+        'implementation': 'Required',
+        'questions': [
+            'Documentation reviewed and updated as needed?',
+            'Changes documented?'
+        ]
+    },
+])
+
+
+class CheckTable(NamedTuple):
+    """
+    Column-oriented (struct-of-arrays) view of every checklist entry
+
+    Row i across the columns is one check; scans and filters run over a
+    single tuple instead of a hash lookup per check dict.
+    """
+    categories: Tuple[str, ...]
+    regulations: Tuple[str, ...]
+    requirements: Tuple[str, ...]
+    implementations: Tuple[str, ...]
+    questions: Tuple[Tuple[str, ...], ...]
+    evidence_required: Tuple[Tuple[str, ...], ...]
+
+    def view(self, index: int) -> Dict:
+        """Materialize row `index` as a check dict"""
+        check = {
+            'regulation': self.regulations[index],
+            'requirement': self.requirements[index],
+            'implementation': self.implementations[index],
+            'questions': self.questions[index]
+        }
+        if self.evidence_required[index]:
+            check['evidence_required'] = self.evidence_required[index]
+        return check
+
+
+def _build_check_table(checklists: Tuple[Tuple[str, Tuple[Check, ...]], ...]) -> CheckTable:
+    rows = [
+        (category, check.regulation, check.requirement, check.implementation,
+         check.questions, check.evidence_required)
+        for category, checks in checklists
+        for check in checks
+    ]
+    return CheckTable(*(tuple(column) for column in zip(*rows)))
+
+
+@lru_cache(maxsize=None)
+def get_check_table() -> CheckTable:
+    """Columnar view of all checklists, built on first use rather than at import"""
+    return _build_check_table((
+        ('Administrative Safeguards', ADMINISTRATIVE_SAFEGUARD_CHECKS),
+        ('Physical Safeguards', PHYSICAL_SAFEGUARD_CHECKS),
+        ('Technical Safeguards', TECHNICAL_SAFEGUARD_CHECKS),
+        ('Organizational Requirements', ORGANIZATIONAL_REQUIREMENT_CHECKS),
+        ('Policies and Procedures', POLICY_AND_PROCEDURE_CHECKS),
+    ))
+
+
+@lru_cache(maxsize=None)
+def get_arrow_table() -> 'pa.Table':
+    """
+    All checklists as a pyarrow Table for vectorized filtering and grouping
+
+    Category, regulation and implementation are dictionary-encoded; there
+    are only a handful of distinct categories and implementations.
+    """
+    if pa is None:
+        raise ImportError("pyarrow is required for get_arrow_table(); install it with 'pip install pyarrow'")
+
+    table = get_check_table()
+    return pa.table({
+        'category': pa.array(table.categories, pa.dictionary(pa.int8(), pa.string())),
+        'regulation': pa.array(table.regulations, pa.dictionary(pa.int16(), pa.string())),
+        'requirement': pa.array(table.requirements, pa.string()),
+        'implementation': pa.array(table.implementations, pa.dictionary(pa.int8(), pa.string())),
+        'questions': pa.array(table.questions, pa.list_(pa.string())),
+        'evidence_required': pa.array(table.evidence_required, pa.list_(pa.string())),
+    })
+
+
+@lru_cache(maxsize=None)
+def _regulation_index() -> Dict[str, Tuple[Check, ...]]:
+    """Map every parenthesized prefix of every regulation to its checks"""
+    index = defaultdict(list)
+    for checks in (ADMINISTRATIVE_SAFEGUARD_CHECKS, PHYSICAL_SAFEGUARD_CHECKS, TECHNICAL_SAFEGUARD_CHECKS,
+                   ORGANIZATIONAL_REQUIREMENT_CHECKS, POLICY_AND_PROCEDURE_CHECKS):
+        for check in checks:
+            # '§164.308(a)(1)(i)' -> '§164.308', '§164.308(a)', '§164.308(a)(1)', ...
+            parts = check.regulation.split('(')
+            for end in range(1, len(parts) + 1):
+                index['('.join(parts[:end])].append(check)
+    return {prefix: tuple(checks) for prefix, checks in index.items()}
+
+
+def checks_under(prefix: str) -> Tuple[Check, ...]:
+    """
+    All checks whose regulation falls under `prefix`, e.g. '§164.308(a)(5)'
+
+    Prefixes are matched on whole parenthesized segments: '§164.308(a)(1)'
+    does not match '§164.308(a)(10)'.
+    """
+    return _regulation_index().get(prefix, ())
+
+
+def __getattr__(name: str):
+    # Module-level CHECK_TABLE stays available, but is only built when accessed
+    if name == 'CHECK_TABLE':
+        return get_check_table()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Check counts, fixed once the checklists are built
+ADMINISTRATIVE_SAFEGUARD_TOTAL = len(ADMINISTRATIVE_SAFEGUARD_CHECKS)
+PHYSICAL_SAFEGUARD_TOTAL = len(PHYSICAL_SAFEGUARD_CHECKS)
+TECHNICAL_SAFEGUARD_TOTAL = len(TECHNICAL_SAFEGUARD_CHECKS)
+ORGANIZATIONAL_REQUIREMENT_TOTAL = len(ORGANIZATIONAL_REQUIREMENT_CHECKS)
+POLICY_AND_PROCEDURE_TOTAL = len(POLICY_AND_PROCEDURE_CHECKS)
+TOTAL_CHECKS = (
+    ADMINISTRATIVE_SAFEGUARD_TOTAL + PHYSICAL_SAFEGUARD_TOTAL + TECHNICAL_SAFEGUARD_TOTAL
+    + ORGANIZATIONAL_REQUIREMENT_TOTAL + POLICY_AND_PROCEDURE_TOTAL
+)
+
 
 class HIPAAComplianceAudit:
     """
@@ -26,10 +892,20 @@ class HIPAAComplianceAudit:
     - Documentation Requirements (§164.316(b))
     """
 
+    # The built-in audits only return the static checklists, so they run
+    # sequentially. Subclasses whose audit_* overrides do I/O (e.g. querying
+    # a live BAA repository) can raise this to run the categories in threads.
+    audit_workers = 1
+
+    __slots__ = ('organization_name',)
+
     def __init__(self, organization_name: str):
         self.organization_name = organization_name
-        self.audit_results = []
-        self.compliance_score = 0
+
+    @staticmethod
+    def checks_table() -> 'pa.Table':
+        """Built-in checklists as a cached pyarrow Table (requires pyarrow)"""
+        return get_arrow_table()
 
     def audit_administrative_safeguards(self) -> Dict:
         """
@@ -46,815 +922,312 @@ class HIPAAComplianceAudit:
         - Evaluation
         - Business Associate Contracts
         """
-        logger.info("\n[ADMINISTRATIVE SAFEGUARDS - §164.308]")
-
-        checks = []
-
-        # §164.308(a)(1) - Security Management Process
-        checks.extend([
-            {
-                'regulation': '§164.308(a)(1)(i)',
-                'requirement': 'Security Management Process',
-                'implementation': 'Required',
-                'questions': [
-                    'Risk analysis conducted and documented?',
-                    'Risk management strategy implemented?',
-                    'Sanction policy for violations?',
-                    'Information system activity review process?'
-                ],
-                'evidence_required': [
-                    'Risk analysis documentation',
-                    'Risk management plan',
-                    'Sanctions policy',
-                    'Audit logs review procedures'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(1)(ii)(A)',
-                'requirement': 'Risk Analysis',
-                'implementation': 'Required',
-                'questions': [
-                    'Potential risks to ePHI identified?',
-                    'Likelihood and impact assessed?',
-                    'Current security measures evaluated?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(1)(ii)(B)',
-                'requirement': 'Risk Management',
-                'implementation': 'Required',
-                'questions': [
-                    'Security measures implemented to reduce risks?',
-                    'Risks reduced to reasonable and appropriate level?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(1)(ii)(C)',
-                'requirement': 'Sanction Policy',
-                'implementation': 'Required',
-                'questions': [
-                    'Sanctions applied to workforce members who violate policies?',
-                    'Sanction policy documented and communicated?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(1)(ii)(D)',
-                'requirement': 'Information System Activity Review',
-                'implementation': 'Required',
-                'questions': [
-                    'Information system activity regularly reviewed?',
-                    'Audit logs, access reports, security incidents reviewed?'
-                ]
-            }
-        ])
-
-        # §164.308(a)(2) - Assigned Security Responsibility
-        checks.append({
-            'regulation': '§164.308(a)(2)',
-            'requirement': 'Assigned Security Responsibility',
-            'implementation': 'Required',
-            'questions': [
-                'Security official designated?',
-                'Security responsibilities clearly defined?'
-            ],
-            'evidence_required': ['Security officer designation document']
-        })
-
-        # §164.308(a)(3) - Workforce Security
-        checks.extend([
-            {
-                'regulation': '§164.308(a)(3)(i)',
-                'requirement': 'Workforce Security',
-                'implementation': 'Required',
-                'questions': [
-                    'Procedures for workforce member authorization?',
-                    'Workforce clearance procedures?',
-                    'Termination procedures?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(3)(ii)(A)',
-                'requirement': 'Authorization and/or Supervision',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Authorization procedures for workforce access to ePHI?',
-                    'Supervision of workforce members?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(3)(ii)(B)',
-                'requirement': 'Workforce Clearance Procedure',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Clearance procedures appropriate to access level?',
-                    'Background checks conducted?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(3)(ii)(C)',
-                'requirement': 'Termination Procedures',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Procedures for terminating access?',
-                    'Access terminated within 24 hours of termination?'
-                ]
-            }
-        ])
-
-        # §164.308(a)(4) - Information Access Management
-        checks.extend([
-            {
-                'regulation': '§164.308(a)(4)(i)',
-                'requirement': 'Information Access Management',
-                'implementation': 'Required',
-                'questions': [
-                    'Policies for authorizing access to ePHI?',
-                    'Access limited to minimum necessary?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(4)(ii)(B)',
-                'requirement': 'Access Authorization',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Access authorization policies and procedures?',
-                    'Role-based access control implemented?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(4)(ii)(C)',
-                'requirement': 'Access Establishment and Modification',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Procedures for granting access?',
-                    'Procedures for modifying access?',
-                    'Access reviewed periodically?'
-                ]
-            }
-        ])
-
-        # §164.308(a)(5) - Security Awareness and Training
-        checks.extend([
-            {
-                'regulation': '§164.308(a)(5)(i)',
-                'requirement': 'Security Awareness and Training',
-                'implementation': 'Required',
-                'questions': [
-                    'Security awareness training program implemented?',
-                    'All workforce members trained?',
-                    'Annual refresher training provided?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(5)(ii)(A)',
-                'requirement': 'Security Reminders',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Periodic security reminders provided?',
-                    'Phishing awareness training?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(5)(ii)(B)',
-                'requirement': 'Protection from Malicious Software',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Training on malware threats?',
-                    'Antivirus/anti-malware deployed?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(5)(ii)(C)',
-                'requirement': 'Log-in Monitoring',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Login attempts monitored?',
-                    'Unusual login activity reported?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(5)(ii)(D)',
-                'requirement': 'Password Management',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Password policies established?',
-                    'Complex passwords required (8+ chars, uppercase, lowercase, numbers, special)?',
-                    'Password rotation enforced (every 90 days)?',
-                    'Previous passwords prevented from reuse?'
-                ]
-            }
-        ])
-
-        # §164.308(a)(6) - Security Incident Procedures
-        checks.extend([
-            {
-                'regulation': '§164.308(a)(6)(i)',
-                'requirement': 'Security Incident Procedures',
-                'implementation': 'Required',
-                'questions': [
-                    'Procedures for identifying security incidents?',
-                    'Procedures for responding to incidents?',
-                    'Procedures for mitigating harmful effects?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(6)(ii)',
-                'requirement': 'Response and Reporting',
-                'implementation': 'Required',
-                'questions': [
-                    'Incident response plan documented?',
-                    'Incidents tracked and documented?',
-                    'Breaches reported per §164.404-414?'
-                ]
-            }
-        ])
-
-        # §164.308(a)(7) - Contingency Plan
-        checks.extend([
-            {
-                'regulation': '§164.308(a)(7)(i)',
-                'requirement': 'Contingency Plan',
-                'implementation': 'Required',
-                'questions': [
-                    'Data backup plan established?',
-                    'Disaster recovery plan documented?',
-                    'Emergency mode operation plan?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(7)(ii)(A)',
-                'requirement': 'Data Backup Plan',
-                'implementation': 'Required',
-                'questions': [
-                    'ePHI backed up regularly?',
-                    'Backups tested for restore?',
-                    'Backups stored securely offsite?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(7)(ii)(B)',
-                'requirement': 'Disaster Recovery Plan',
-                'implementation': 'Required',
-                'questions': [
-                    'Disaster recovery procedures established?',
-                    'RTO (Recovery Time Objective) defined?',
-                    'RPO (Recovery Point Objective) defined?',
-                    'Plan tested annually?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(7)(ii)(C)',
-                'requirement': 'Emergency Mode Operation Plan',
-                'implementation': 'Required',
-                'questions': [
-                    'Emergency operations procedures established?',
-                    'ePHI accessible during emergencies?'
-                ]
-            },
-            {
-                'regulation': '§164.308(a)(7)(ii)(E)',
-                'requirement': 'Applications and Data Criticality Analysis',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Critical applications identified?',
-                    'Data criticality assessed?',
-                    'Priority recovery order established?'
-                ]
-            }
-        ])
-
-        # §164.308(a)(8) - Evaluation
-        checks.append({
-            'regulation': '§164.308(a)(8)',
-            'requirement': 'Evaluation',
-            'implementation': 'Required',
-            'questions': [
-                'Periodic technical and non-technical evaluations conducted?',
-                'Security measures effectiveness assessed?',
-                'Evaluations conducted at least annually?',
-                'Evaluations after environmental or operational changes?'
-            ],
-            'evidence_required': ['Annual security evaluation reports']
-        })
-
-        # §164.308(b) - Business Associate Contracts
-        checks.append({
-            'regulation': '§164.308(b)(1)',
-            'requirement': 'Business Associate Contracts',
-            'implementation': 'Required',
-            'questions': [
-                'Written BAAs with all business associates?',
-                'BAAs include required provisions (§164.314)?',
-                'Subcontractor agreements in place?'
-            ],
-            'evidence_required': ['Signed Business Associate Agreements']
-        })
+        logger.info("[ADMINISTRATIVE SAFEGUARDS - §164.308]")
 
         return {
             'category': 'Administrative Safeguards',
             'regulation': '§164.308',
-            'total_checks': len(checks),
-            'checks': checks
+            'total_checks': ADMINISTRATIVE_SAFEGUARD_TOTAL,
+            'checks': ADMINISTRATIVE_SAFEGUARD_CHECKS
         }
 
     def audit_physical_safeguards(self) -> Dict:
         """Audit Physical Safeguards (§164.310)"""
-        logger.info("\n[PHYSICAL SAFEGUARDS - §164.310]")
-
-        checks = []
-
-        # §164.310(a) - Facility Access Controls
-        checks.extend([
-            {
-                'regulation': '§164.310(a)(1)',
-                'requirement': 'Facility Access Controls',
-                'implementation': 'Required',
-                'questions': [
-                    'Procedures to limit physical access to ePHI?',
-                    'Authorized personnel only can access facilities?'
-                ]
-            },
-            {
-                'regulation': '§164.310(a)(2)(i)',
-                'requirement': 'Contingency Operations',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Facility access procedures during emergencies?'
-                ]
-            },
-            {
-                'regulation': '§164.310(a)(2)(ii)',
-                'requirement': 'Facility Security Plan',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Facility security plan documented?',
-                    'Physical barriers (locks, badges)?',
-                    'Visitor logs maintained?'
-                ]
-            },
-            {
-                'regulation': '§164.310(a)(2)(iii)',
-                'requirement': 'Access Control and Validation Procedures',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Procedures for controlling/validating access?',
-                    'Badge access system?',
-                    'Sign-in/sign-out logs?'
-                ]
-            },
-            {
-                'regulation': '§164.310(a)(2)(iv)',
-                'requirement': 'Maintenance Records',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Facility repairs/modifications documented?',
-                    'Security impact assessed?'
-                ]
-            }
-        ])
-
-        # §164.310(b) - Workstation Use
-        checks.append({
-            'regulation': '§164.310(b)',
-            'requirement': 'Workstation Use',
-            'implementation': 'Required',
-            'questions': [
-                'Policies for workstation use?',
-                'Proper use of workstations accessing ePHI defined?',
-                'Acceptable use policy documented?'
-            ]
-        })
-
-        # §164.310(c) - Workstation Security
-        checks.append({
-            'regulation': '§164.310(c)',
-            'requirement': 'Workstation Security',
-            'implementation': 'Required',
-            'questions': [
-                'Physical safeguards for workstations?',
-                'Privacy screens used?',
-                'Auto-lock after inactivity (15 min)?',
-                'Workstations positioned to minimize ePHI exposure?'
-            ]
-        })
-
-        # §164.310(d) - Device and Media Controls
-        checks.extend([
-            {
-                'regulation': '§164.310(d)(1)',
-                'requirement': 'Device and Media Controls',
-                'implementation': 'Required',
-                'questions': [
-                    'Policies for receipt and removal of hardware/media?',
-                    'ePHI disposal procedures?',
-                    'Media reuse procedures?'
-                ]
-            },
-            {
-                'regulation': '§164.310(d)(2)(i)',
-                'requirement': 'Disposal',
-                'implementation': 'Required',
-                'questions': [
-                    'Procedures for final disposal of ePHI?',
-                    'Secure deletion/destruction methods?',
-                    'Certificate of destruction obtained?'
-                ]
-            },
-            {
-                'regulation': '§164.310(d)(2)(ii)',
-                'requirement': 'Media Re-use',
-                'implementation': 'Required',
-                'questions': [
-                    'Procedures for removing ePHI before reuse?',
-                    'Secure wiping procedures?'
-                ]
-            },
-            {
-                'regulation': '§164.310(d)(2)(iii)',
-                'requirement': 'Accountability',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Hardware/media movements tracked?',
-                    'Inventory of devices maintained?'
-                ]
-            },
-            {
-                'regulation': '§164.310(d)(2)(iv)',
-                'requirement': 'Data Backup and Storage',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Backup media stored securely?',
-                    'Offsite backup storage?',
-                    'Backup media encrypted?'
-                ]
-            }
-        ])
+        logger.info("[PHYSICAL SAFEGUARDS - §164.310]")
 
         return {
             'category': 'Physical Safeguards',
             'regulation': '§164.310',
-            'total_checks': len(checks),
-            'checks': checks
+            'total_checks': PHYSICAL_SAFEGUARD_TOTAL,
+            'checks': PHYSICAL_SAFEGUARD_CHECKS
         }
 
     def audit_technical_safeguards(self) -> Dict:
         """Audit Technical Safeguards (§164.312)"""
-        logger.info("\n[TECHNICAL SAFEGUARDS - §164.312]")
-
-        checks = []
-
-        # §164.312(a) - Access Control
-        checks.extend([
-            {
-                'regulation': '§164.312(a)(1)',
-                'requirement': 'Access Control',
-                'implementation': 'Required',
-                'questions': [
-                    'Technical policies to limit ePHI access?',
-                    'Access limited to authorized persons?'
-                ]
-            },
-            {
-                'regulation': '§164.312(a)(2)(i)',
-                'requirement': 'Unique User Identification',
-                'implementation': 'Required',
-                'questions': [
-                    'Unique user IDs assigned?',
-                    'No shared accounts?',
-                    'User identification tracked in audit logs?'
-                ]
-            },
-            {
-                'regulation': '§164.312(a)(2)(ii)',
-                'requirement': 'Emergency Access Procedure',
-                'implementation': 'Required',
-                'questions': [
-                    'Emergency access procedures established?',
-                    'Break-glass accounts available?',
-                    'Emergency access logged and reviewed?'
-                ]
-            },
-            {
-                'regulation': '§164.312(a)(2)(iii)',
-                'requirement': 'Automatic Logoff',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Automatic logoff after inactivity?',
-                    'Timeout set to 15 minutes or less?'
-                ]
-            },
-            {
-                'regulation': '§164.312(a)(2)(iv)',
-                'requirement': 'Encryption and Decryption',
-                'implementation': 'Addressable',
-                'questions': [
-                    'ePHI encrypted at rest?',
-                    'Encryption algorithm (AES-256)?',
-                    'ePHI encrypted in transit (TLS 1.2/1.3)?',
-                    'Encryption keys managed securely?'
-                ]
-            }
-        ])
-
-        # §164.312(b) - Audit Controls
-        checks.append({
-            'regulation': '§164.312(b)',
-            'requirement': 'Audit Controls',
-            'implementation': 'Required',
-            'questions': [
-                'Audit logs implemented?',
-                'All ePHI access logged?',
-                'Logs include: user ID, timestamp, action, resource?',
-                'Logs retained for 6 years?',
-                'Logs protected from modification?',
-                'Logs reviewed regularly?'
-            ],
-            'evidence_required': ['Audit log samples', 'Log review procedures']
-        })
-
-        # §164.312(c) - Integrity
-        checks.extend([
-            {
-                'regulation': '§164.312(c)(1)',
-                'requirement': 'Integrity',
-                'implementation': 'Required',
-                'questions': [
-                    'Policies to ensure ePHI not improperly altered/destroyed?',
-                    'Data integrity controls implemented?'
-                ]
-            },
-            {
-                'regulation': '§164.312(c)(2)',
-                'requirement': 'Mechanism to Authenticate ePHI',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Methods to verify ePHI not altered?',
-                    'Digital signatures or checksums used?',
-                    'Version control implemented?'
-                ]
-            }
-        ])
-
-        # §164.312(d) - Person or Entity Authentication
-        checks.append({
-            'regulation': '§164.312(d)',
-            'requirement': 'Person or Entity Authentication',
-            'implementation': 'Required',
-            'questions': [
-                'Authentication procedures implemented?',
-                'Multi-factor authentication (MFA) required?',
-                'Password complexity enforced?',
-                'Failed login attempts tracked?',
-                'Account lockout after 5 failed attempts?'
-            ]
-        })
-
-        # §164.312(e) - Transmission Security
-        checks.extend([
-            {
-                'regulation': '§164.312(e)(1)',
-                'requirement': 'Transmission Security',
-                'implementation': 'Required',
-                'questions': [
-                    'Technical measures to guard against unauthorized ePHI access during transmission?',
-                    'Network security measures?'
-                ]
-            },
-            {
-                'regulation': '§164.312(e)(2)(i)',
-                'requirement': 'Integrity Controls',
-                'implementation': 'Addressable',
-                'questions': [
-                    'Measures to ensure transmitted ePHI not improperly modified?',
-                    'Message authentication codes used?'
-                ]
-            },
-            {
-                'regulation': '§164.312(e)(2)(ii)',
-                'requirement': 'Encryption',
-                'implementation': 'Addressable',
-                'questions': [
-                    'ePHI encrypted during network transmission?',
-                    'TLS 1.2 or higher used?',
-                    'VPN for remote access?',
-                    'Email encryption for ePHI?'
-                ]
-            }
-        ])
+        logger.info("[TECHNICAL SAFEGUARDS - §164.312]")
 
         return {
             'category': 'Technical Safeguards',
             'regulation': '§164.312',
-            'total_checks': len(checks),
-            'checks': checks
+            'total_checks': TECHNICAL_SAFEGUARD_TOTAL,
+            'checks': TECHNICAL_SAFEGUARD_CHECKS
         }
 
     def audit_organizational_requirements(self) -> Dict:
         """Audit Organizational Requirements (§164.314)"""
-        logger.info("\n[ORGANIZATIONAL REQUIREMENTS - §164.314]")
-
-        checks = []
-
-        # §164.314(a) - Business Associate Contracts
-        checks.extend([
-            {
-                'regulation': '§164.314(a)(1)',
-                'requirement': 'Business Associate Contracts or Other Arrangements',
-                'implementation': 'Required',
-                'questions': [
-                    'Written BAAs with all business associates?',
-                    'BAAs include all required provisions?',
-                    'BAAs reviewed annually?'
-                ]
-            },
-            {
-                'regulation': '§164.314(a)(2)(i)',
-                'requirement': 'BAA Required Provisions',
-                'implementation': 'Required',
-                'questions': [
-                    'BAA requires BA to comply with HIPAA?',
-                    'BAA requires safeguards for ePHI?',
-                    'BAA requires breach reporting?',
-                    'BAA requires subcontractor agreements?',
-                    'BAA allows termination for violations?'
-                ]
-            }
-        ])
-
-        # §164.314(b) - Other Arrangements
-        checks.append({
-            'regulation': '§164.314(b)(1)',
-            'requirement': 'Requirements for Group Health Plans',
-            'implementation': 'Required',
-            'questions': [
-                'Group health plan documents include privacy provisions?'
-            ]
-        })
+        logger.info("[ORGANIZATIONAL REQUIREMENTS - §164.314]")
 
         return {
             'category': 'Organizational Requirements',
             'regulation': '§164.314',
-            'total_checks': len(checks),
-            'checks': checks
+            'total_checks': ORGANIZATIONAL_REQUIREMENT_TOTAL,
+            'checks': ORGANIZATIONAL_REQUIREMENT_CHECKS
         }
 
     def audit_policies_and_procedures(self) -> Dict:
         """Audit Policies and Procedures (§164.316)"""
-        logger.info("\n[POLICIES AND PROCEDURES - §164.316]")
-
-        checks = []
-
-        # §164.316(a) - Policies and Procedures
-        checks.append({
-            'regulation': '§164.316(a)',
-            'requirement': 'Policies and Procedures',
-            'implementation': 'Required',
-            'questions': [
-                'Written policies and procedures for all HIPAA requirements?',
-                'Policies reviewed annually?',
-                'Policies approved by management?',
-                'Policies accessible to workforce?'
-            ],
-            'evidence_required': ['Complete HIPAA policies and procedures manual']
-        })
-
-        # §164.316(b) - Documentation
-        checks.extend([
-            {
-                'regulation': '§164.316(b)(1)',
-                'requirement': 'Documentation',
-                'implementation': 'Required',
-                'questions': [
-                    'All required documentation maintained?',
-                    'Documentation includes policies, procedures, actions, activities, assessments?',
-                    'Documentation retained for 6 years?',
-                    'Documentation available to workforce and for review?'
-                ]
-            },
-            {
-                'regulation': '§164.316(b)(2)(i)',
-                'requirement': 'Time Limit',
-                'implementation': 'Required',
-                'questions': [
-                    'Documentation retained for 6 years from creation or last effective date?'
-                ]
-            },
-            {
-                'regulation': '§164.316(b)(2)(ii)',
-                'requirement': 'Availability',
-                'implementation': 'Required',
-                'questions': [
-                    'Documentation made available to responsible parties?'
-                ]
-            },
-            {
-                'regulation': '§164.316(b)(2)(iii)',
-                'requirement': 'Updates',
-                'implementation': 'Required',
-                'questions': [
-                    'Documentation reviewed and updated as needed?',
-                    'Changes documented?'
-                ]
-            }
-        ])
+        logger.info("[POLICIES AND PROCEDURES - §164.316]")
 
         return {
             'category': 'Policies and Procedures',
             'regulation': '§164.316',
-            'total_checks': len(checks),
-            'checks': checks
+            'total_checks': POLICY_AND_PROCEDURE_TOTAL,
+            'checks': POLICY_AND_PROCEDURE_CHECKS
         }
 
     def conduct_full_audit(self) -> Dict:
-        """Conduct complete HIPAA compliance audit"""
-        logger.info("="*70)
-        logger.info("HIPAA SECURITY RULE COMPLIANCE AUDIT")
-        logger.info(f"Organization: {self.organization_name}")
-        logger.info(f"Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        logger.info("="*70)
-
-        # Run all audits
-        results = []
-        results.append(self.audit_administrative_safeguards())
-        results.append(self.audit_physical_safeguards())
-        results.append(self.audit_technical_safeguards())
-        results.append(self.audit_organizational_requirements())
-        results.append(self.audit_policies_and_procedures())
-
-        # Generate comprehensive report
-        report = self.generate_compliance_report(results)
+        """
+        Conduct complete HIPAA compliance audit
+
+        For the built-in checklists the report's dicts and lists are the
+        caller's own, but the check and evidence entries inside them are
+        shared with later audits and must be treated as read-only.
+        """
+        self._log_audit_banner()
+
+        # Audits overridden by a subclass may query live systems, so only the
+        # built-in checklists are served from the memoized report
+        if not _uses_builtin_audits(type(self)):
+            return self.generate_compliance_report(self._run_audits())
+
+        # Everything except the audit date is deterministic per organization
+        report = _copy_report_containers(_build_static_report(type(self), self.organization_name))
+        report['audit_date'] = _now_iso(int(time.time()))
+        self._log_audit_summary(report)
 
         return report
 
+    def conduct_full_audit_json(self) -> bytes:
+        """
+        Conduct the audit and return the report as compact JSON bytes
+
+        For the built-in checklists the report is serialized once per
+        organization; each call only splices the current audit date into
+        the cached bytes.
+        """
+        return b''.join(self._report_json_parts())
+
+    def conduct_full_audit_to(self, stream):
+        """
+        Conduct the audit and write the report as compact JSON to a binary stream
+
+        Writes the cached bytes on either side of the audit date directly,
+        without assembling the report in memory first.
+        """
+        for part in self._report_json_parts():
+            stream.write(part)
+
+    def _report_json_parts(self) -> Tuple[bytes, ...]:
+        """Conduct the audit and return its compact JSON in consecutive pieces"""
+        self._log_audit_banner()
+
+        if not _uses_builtin_audits(type(self)):
+            return (_dumps_compact(self.generate_compliance_report(self._run_audits())),)
+
+        self._log_audit_summary(_build_static_report(type(self), self.organization_name))
+        head, tail = _static_report_parts(type(self), self.organization_name)
+        return head, json.dumps(_now_iso(int(time.time()))).encode(), tail
+
+    def _log_audit_banner(self):
+        if logger.isEnabledFor(logging.INFO):
+            audit_date = _now_iso(int(time.time()))
+            logger.info(_AUDIT_BANNER, self.organization_name, audit_date[:19].replace('T', ' '))
+
+    def _run_audits(self) -> List[Dict]:
+        """Run all category audits in report order"""
+        audits = (
+            self.audit_administrative_safeguards,
+            self.audit_physical_safeguards,
+            self.audit_technical_safeguards,
+            self.audit_organizational_requirements,
+            self.audit_policies_and_procedures
+        )
+
+        if self.audit_workers <= 1:
+            return [audit() for audit in audits]
+
+        # map() yields results in submission order, preserving report order
+        with ThreadPoolExecutor(max_workers=self.audit_workers) as executor:
+            return list(executor.map(lambda audit: audit(), audits))
+
     def generate_compliance_report(self, results: List[Dict]) -> Dict:
         """Generate comprehensive compliance report"""
+        report = self._compile_report(results)
+        self._log_audit_summary(report)
+        return report
+
+    def _compile_report(self, results: List[Dict]) -> Dict:
+        """Assemble the compliance report without logging it"""
+        # Built-in audits add up to TOTAL_CHECKS, but results may come from
+        # overridden audit_* methods
         total_checks = sum(r['total_checks'] for r in results)
 
-        report = {
+        return {
             'organization': self.organization_name,
-            'audit_date': datetime.now().isoformat(),
+            'audit_date': _now_iso(int(time.time())),
             'auditor': 'Automated HIPAA Compliance Audit System',
             'total_requirements_checked': total_checks,
-            'results_by_category': results,
+            'results_by_category': [_plain_result(result) for result in results],
             'required_evidence': self._collect_required_evidence(results),
             'recommendations': self._generate_recommendations(results)
         }
 
-        # Print summary
-        logger.info("\n" + "="*70)
-        logger.info("AUDIT SUMMARY")
-        logger.info("="*70)
-        logger.info(f"Total Requirements Checked: {total_checks}")
-        logger.info("\nRequirements by Category:")
-        for result in results:
-            logger.info(f"  {result['category']}: {result['total_checks']} checks")
-
-        logger.info(f"\nTotal Evidence Items Required: {len(report['required_evidence'])}")
-        logger.info("="*70)
-
-        return report
+    def _log_audit_summary(self, report: Dict):
+        if logger.isEnabledFor(logging.INFO):
+            results = report['results_by_category']
+            lines = [_RULE, "AUDIT SUMMARY", _RULE, f"Total Requirements Checked: {report['total_requirements_checked']}",
+                     "", "Requirements by Category:"]
+            lines.extend(f"  {result['category']}: {result['total_checks']} checks" for result in results)
+            lines.extend(["", f"Total Evidence Items Required: {len(report['required_evidence'])}", _RULE])
+            logger.info("\n".join(lines))
 
     def _collect_required_evidence(self, results: List[Dict]) -> List[Dict]:
         """Collect all required evidence items"""
-        evidence = []
-        for category_result in results:
-            for check in category_result['checks']:
-                if 'evidence_required' in check:
-                    for item in check['evidence_required']:
-                        evidence.append({
-                            'category': category_result['category'],
-                            'regulation': check['regulation'],
-                            'requirement': check['requirement'],
-                            'evidence': item
-                        })
-        return evidence
+        # Overridden audits may still return plain check dicts; coercing them
+        # to Check records also makes the signature hashable
+        signature = tuple(
+            (r['category'], tuple(Check.coerce(check) for check in r['checks']))
+            for r in results
+        )
+        # The cached dicts are shared, so every caller gets its own copies
+        return [dict(item) for item in _evidence_for(signature)]
 
     def _generate_recommendations(self, results: List[Dict]) -> List[str]:
         """Generate compliance recommendations"""
-        recommendations = [
-            "1. Conduct annual risk analysis and document findings",
-            "2. Implement multi-factor authentication (MFA) for all ePHI access",
-            "3. Ensure all workforce members complete annual HIPAA training",
-            "4. Maintain audit logs for all ePHI access (6-year retention)",
-            "5. Encrypt all ePHI at rest (AES-256) and in transit (TLS 1.3)",
-            "6. Implement automatic logoff after 15 minutes of inactivity",
-            "7. Test disaster recovery plan annually",
-            "8. Review and update Business Associate Agreements",
-            "9. Conduct security incident response drills quarterly",
-            "10. Document all policies and procedures (6-year retention)",
-            "11. Implement role-based access control (RBAC)",
-            "12. Perform penetration testing annually",
-            "13. Conduct vulnerability scans quarterly",
-            "14. Maintain inventory of all devices accessing ePHI",
-            "15. Implement secure disposal procedures for all media containing ePHI"
-        ]
-        return recommendations
+        return list(_RECOMMENDATIONS)
 
     def save_report(self, report: Dict, filename: str):
         """Save audit report to file"""
-        with open(filename, 'w') as f:
-            json.dump(report, f, indent=2)
-        logger.info(f"\nDetailed audit report saved to: {filename}")
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(report, f, indent=2)
+        logger.info("Detailed audit report saved to: %s", filename)
+
+
+_RECOMMENDATIONS: Tuple[str, ...] = (
+    "1. Conduct annual risk analysis and document findings",
+    "2. Implement multi-factor authentication (MFA) for all ePHI access",
+    "3. Ensure all workforce members complete annual HIPAA training",
+    "4. Maintain audit logs for all ePHI access (6-year retention)",
+    "5. Encrypt all ePHI at rest (AES-256) and in transit (TLS 1.3)",
+    "6. Implement automatic logoff after 15 minutes of inactivity",
+    "7. Test disaster recovery plan annually",
+    "8. Review and update Business Associate Agreements",
+    "9. Conduct security incident response drills quarterly",
+    "10. Document all policies and procedures (6-year retention)",
+    "11. Implement role-based access control (RBAC)",
+    "12. Perform penetration testing annually",
+    "13. Conduct vulnerability scans quarterly",
+    "14. Maintain inventory of all devices accessing ePHI",
+    "15. Implement secure disposal procedures for all media containing ePHI"
+)
+
+
+@lru_cache(maxsize=32)
+def _evidence_for(signature: Tuple[Tuple[str, Tuple[Check, ...]], ...]) -> Tuple[Dict, ...]:
+    """Evidence items for (category, checks) pairs; the returned dicts are shared"""
+    # dict.fromkeys drops repeated items while keeping first-seen order
+    keys = dict.fromkeys(
+        (category, check.regulation, check.requirement, item)
+        for category, checks in signature
+        for check in checks
+        for item in check.evidence_required
+    )
+    return tuple(
+        {'category': category, 'regulation': regulation, 'requirement': requirement, 'evidence': item}
+        for category, regulation, requirement, item in keys
+    )
+
+
+# Methods whose built-in versions make the report a pure function of the
+# organization name; a subclass overriding any of them is never memoized
+_REPORT_METHODS = (
+    '__init__',
+    'audit_administrative_safeguards',
+    'audit_physical_safeguards',
+    'audit_technical_safeguards',
+    'audit_organizational_requirements',
+    'audit_policies_and_procedures',
+    '_run_audits',
+    '_compile_report',
+    '_collect_required_evidence',
+    '_generate_recommendations'
+)
+
+
+@lru_cache(maxsize=None)
+def _uses_builtin_audits(auditor_cls: type) -> bool:
+    """Whether an auditor class builds its report from the built-in checklists only"""
+    return all(
+        getattr(auditor_cls, name) is getattr(HIPAAComplianceAudit, name)
+        for name in _REPORT_METHODS
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_static_report(auditor_cls: type, organization_name: str) -> Dict:
+    """
+    Build the full compliance report for an organization once per process
+
+    Only used for classes where _uses_builtin_audits() holds. The cached
+    report is shared and must not be mutated; hand out
+    _copy_report_containers() copies.
+    """
+    auditor = auditor_cls(organization_name)
+    return auditor._compile_report(auditor._run_audits())
+
+
+def _plain_result(result: Dict) -> Dict:
+    """Category result with its Check records as plain dicts, as reports carry them"""
+    return dict(result, checks=[
+        check.as_dict() if isinstance(check, Check) else check for check in result['checks']
+    ])
+
+
+def _copy_report_containers(report: Dict) -> Dict:
+    """
+    Copy a report's dicts and lists, sharing the check and evidence entries
+
+    Appending to or replacing anything in the copy leaves the original
+    intact, at a fraction of a deep copy's cost.
+    """
+    report = dict(report)
+    report['results_by_category'] = [
+        dict(result, checks=list(result['checks'])) for result in report['results_by_category']
+    ]
+    report['required_evidence'] = list(report['required_evidence'])
+    report['recommendations'] = list(report['recommendations'])
+    return report
+
+
+def _dumps_compact(obj) -> bytes:
+    """Compact JSON bytes, with orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+
+@lru_cache(maxsize=32)
+def _static_report_parts(auditor_cls: type, organization_name: str) -> Tuple[bytes, bytes]:
+    """
+    Serialized report split into the bytes before and after the audit date value
+
+    The fields on either side of 'audit_date' are serialized separately, so
+    no user-supplied text is ever searched for the split point.
+    """
+    report = _build_static_report(auditor_cls, organization_name)
+    keys = list(report)
+    split = keys.index('audit_date')
+    before = _dumps_compact({key: report[key] for key in keys[:split]})
+    after = _dumps_compact({key: report[key] for key in keys[split + 1:]})
+
+    # '{...}' + '"audit_date":' ... ',' + '...}', dropping the inner braces
+    head = before[:-1] + (b',' if split else b'') + b'"audit_date":'
+    tail = b',' + after[1:] if split + 1 < len(keys) else b'}'
+    return head, tail
 
 
 if __name__ == "__main__":
@@ -866,6 +1239,8 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
+    logging.basicConfig(level=logging.INFO)
+
     # Conduct audit
     auditor = HIPAAComplianceAudit(args.organization)
     report = auditor.conduct_full_audit()
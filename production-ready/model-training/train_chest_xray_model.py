@@ -16,8 +16,10 @@ import pandas as pd
 import numpy as np
 from PIL import Image
 from sklearn.model_selection import train_test_split
-from sklearn.metrics import roc_auc_score, confusion_matrix
+from sklearn.metrics import confusion_matrix
 import os
+import math
+from concurrent.futures import ThreadPoolExecutor
 import logging
 from tqdm import tqdm
 import json
@@ -25,13 +27,73 @@ import json
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from nvidia.dali import pipeline_def, fn, types
+    from nvidia.dali.plugin.pytorch import DALIGenericIterator, LastBatchPolicy
+    DALI_AVAILABLE = True
+except ImportError:
+    DALI_AVAILABLE = False
+
+IMAGENET_MEAN = [0.485, 0.456, 0.406]
+IMAGENET_STD = [0.229, 0.224, 0.225]
+IMAGE_SIZE = 224
+
+
+def cpu_state_copy(state):
+    """Snapshot a (nested) state dict onto the CPU so it can be saved while training continues"""
+    if isinstance(state, torch.Tensor):
+        return state.detach().to('cpu', copy=True)
+    if isinstance(state, dict):
+        return {key: cpu_state_copy(value) for key, value in state.items()}
+    if isinstance(state, (list, tuple)):
+        return type(state)(cpu_state_copy(value) for value in state)
+    return state
+
+
+def rank_sum_auc(labels, scores):
+    """
+    Per-class AUC-ROC of (N, C) tensors via the Mann-Whitney rank-sum identity
+
+    Runs on the tensors' device. Tied scores get their average rank, matching
+    sklearn's roc_auc_score; classes with only one label value score 0.0.
+    """
+    num_samples, num_classes = scores.shape
+    aucs = torch.zeros(num_classes, dtype=torch.float64, device=scores.device)
+
+    for i in range(num_classes):
+        sorted_scores, order = torch.sort(scores[:, i])
+        _, group, counts = torch.unique_consecutive(sorted_scores, return_inverse=True, return_counts=True)
+        # 1-based average rank of each run of tied scores
+        group_ranks = counts.cumsum(0).double() - (counts.double() - 1) / 2
+        ranks = torch.empty(num_samples, dtype=torch.float64, device=scores.device)
+        ranks[order] = group_ranks[group]
+
+        positives = labels[:, i] > 0.5
+        n_pos = positives.sum().double()
+        n_neg = num_samples - n_pos
+        auc = (ranks[positives].sum() - n_pos * (n_pos + 1) / 2) / (n_pos * n_neg)
+        aucs[i] = torch.where((n_pos > 0) & (n_neg > 0), auc, torch.zeros_like(auc))
+
+    return aucs
+
+
+def remove_if_exists(path):
+    if os.path.exists(path):
+        os.remove(path)
+
 
 class ChestXrayDataset(Dataset):
     """NIH ChestX-ray14 Dataset"""
 
     def __init__(self, image_paths, labels, transform=None):
         self.image_paths = image_paths
-        self.labels = labels
+        # One contiguous (N, C) tensor; each item is a row view
+        self.labels = torch.as_tensor(np.ascontiguousarray(labels, dtype=np.float32))
         self.transform = transform
 
     def __len__(self):
@@ -43,11 +105,151 @@ class ChestXrayDataset(Dataset):
         if self.transform:
             image = self.transform(image)
 
-        label = torch.tensor(self.labels[idx], dtype=torch.float32)
+        label = self.labels[idx]
+
+        return image, label
+
+
+class CachedChestXrayDataset(Dataset):
+    """
+    ChestX-ray14 samples read from a pre-decoded (N, 224, 224, 3) uint8 array
+
+    `images` is typically the memory-mapped cache written by
+    ChestXrayTrainer.prepare_cache; `indices` selects this split's rows.
+    Transforms operate on CHW uint8 tensors.
+    """
+
+    def __init__(self, images, indices, labels, transform=None):
+        self.images = images
+        self.indices = np.asarray(indices)
+        self.labels = torch.as_tensor(np.ascontiguousarray(labels, dtype=np.float32))
+        self.transform = transform
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, idx):
+        image = torch.from_numpy(np.array(self.images[self.indices[idx]])).permute(2, 0, 1)
+
+        if self.transform:
+            image = self.transform(image)
+
+        label = self.labels[idx]
 
         return image, label
 
 
+def build_dali_pipeline(image_paths, batch_size, device_id, training, num_threads=4, seed=42):
+    """
+    DALI pipeline that decodes, resizes, augments and normalizes on the GPU
+
+    Samples are labelled with their index into image_paths; DALIChestXrayLoader
+    maps the indices back to multi-label targets.
+    """
+    @pipeline_def(batch_size=batch_size, num_threads=num_threads, device_id=device_id, seed=seed)
+    def chest_xray_pipeline():
+        encoded, indices = fn.readers.file(
+            files=list(image_paths),
+            labels=list(range(len(image_paths))),
+            random_shuffle=training,
+            name='Reader'
+        )
+        images = fn.decoders.image(encoded, device='mixed', output_type=types.RGB)
+        images = fn.resize(images, resize_x=224, resize_y=224)
+
+        mirror = 0
+        if training:
+            images = fn.rotate(images, angle=fn.random.uniform(range=(-10.0, 10.0)), keep_size=True, fill_value=0)
+            images = fn.brightness_contrast(
+                images,
+                brightness=fn.random.uniform(range=(0.8, 1.2)),
+                contrast=fn.random.uniform(range=(0.8, 1.2))
+            )
+            mirror = fn.random.coin_flip()
+
+        images = fn.crop_mirror_normalize(
+            images,
+            dtype=types.FLOAT,
+            output_layout='CHW',
+            mean=[m * 255 for m in IMAGENET_MEAN],
+            std=[s * 255 for s in IMAGENET_STD],
+            mirror=mirror
+        )
+        return images, indices.gpu()
+
+    pipe = chest_xray_pipeline()
+    pipe.build()
+    return pipe
+
+
+class DALIChestXrayLoader:
+    """Iterates a DALI pipeline as (images, labels) batches already on the GPU"""
+
+    def __init__(self, image_paths, labels, batch_size, device, training):
+        device_id = device.index if device.index is not None else torch.cuda.current_device()
+        self.num_samples = len(image_paths)
+        self.batch_size = batch_size
+        self.labels = torch.as_tensor(np.asarray(labels), dtype=torch.float32, device=device)
+        self.iterator = DALIGenericIterator(
+            build_dali_pipeline(image_paths, batch_size, device_id, training),
+            ['images', 'indices'],
+            reader_name='Reader',
+            last_batch_policy=LastBatchPolicy.PARTIAL,
+            auto_reset=True
+        )
+
+    def __len__(self):
+        return math.ceil(self.num_samples / self.batch_size)
+
+    def __iter__(self):
+        for batch in self.iterator:
+            indices = batch[0]['indices'].view(-1).long()
+            yield batch[0]['images'], self.labels[indices]
+
+
+class CUDAPrefetcher:
+    """
+    Copies the next batch to the GPU on a side stream while the current one trains
+
+    Wraps a DataLoader with pinned memory; batches come out on `device`
+    with images in channels_last.
+    """
+
+    def __init__(self, loader, device):
+        self.loader = loader
+        self.device = device
+        self.stream = torch.cuda.Stream(device=device)
+
+    def __len__(self):
+        return len(self.loader)
+
+    def _preload(self, iterator):
+        try:
+            images, labels = next(iterator)
+        except StopIteration:
+            return None
+
+        with torch.cuda.stream(self.stream):
+            images = images.to(self.device, non_blocking=True).to(memory_format=torch.channels_last)
+            labels = labels.to(self.device, non_blocking=True)
+        return images, labels
+
+    def __iter__(self):
+        iterator = iter(self.loader)
+        batch = self._preload(iterator)
+
+        while batch is not None:
+            current_stream = torch.cuda.current_stream(self.device)
+            current_stream.wait_stream(self.stream)
+            images, labels = batch
+            # Tensors were allocated on the side stream; keep them alive for the compute stream
+            images.record_stream(current_stream)
+            labels.record_stream(current_stream)
+
+            batch = self._preload(iterator)
+            yield images, labels
+
+
 class ChestXrayTrainer:
     """Training pipeline for chest X-ray classifier"""
 
@@ -65,13 +267,26 @@ class ChestXrayTrainer:
         batch_size: int = 32,
         num_epochs: int = 50,
         learning_rate: float = 1e-4,
-        device: str = None
+        device: str = None,
+        use_dali: bool = False,
+        keep_checkpoints: int = 3,
+        compile_model: bool = True,
+        quantize: bool = False,
+        num_workers: int = None,
+        grad_accum_steps: int = 1
     ):
         self.data_dir = data_dir
         self.output_dir = output_dir
         self.batch_size = batch_size
         self.num_epochs = num_epochs
         self.learning_rate = learning_rate
+        # Effective batch size is batch_size * grad_accum_steps
+        self.grad_accum_steps = max(1, grad_accum_steps)
+        self.keep_checkpoints = keep_checkpoints
+        self.compile_model = compile_model
+        self.quantize = quantize
+        # Workers stay alive across epochs; default to half the cores for PIL decoding
+        self.num_workers = num_workers if num_workers is not None else max(4, (os.cpu_count() or 8) // 2)
 
         # Device
         if device is None:
@@ -81,73 +296,155 @@ class ChestXrayTrainer:
 
         logger.info(f"Using device: {self.device}")
 
+        # Mixed precision: bf16 autocast where the GPU supports it (no loss
+        # scaling needed), otherwise fp16 with a GradScaler
+        self.use_amp = self.device.type == 'cuda'
+        if self.use_amp:
+            torch.backends.cudnn.benchmark = True  # fixed 224x224 NHWC input
+            self.amp_dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        else:
+            self.amp_dtype = torch.float32
+
+        # GPU decode/augmentation via DALI, when available
+        self.use_dali = use_dali and DALI_AVAILABLE and self.device.type == 'cuda'
+        if use_dali and not self.use_dali:
+            logger.warning("DALI requested but unavailable (needs nvidia-dali and a CUDA device); using PIL data loading")
+
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
 
-        # Transforms
+        # Transforms; batches stay uint8 on the host and are normalized on the device
         self.train_transform = transforms.Compose([
             transforms.Resize((224, 224)),
             transforms.RandomHorizontalFlip(),
             transforms.RandomRotation(10),
             transforms.ColorJitter(brightness=0.2, contrast=0.2),
-            transforms.ToTensor(),
-            transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
+            transforms.PILToTensor()
         ])
 
         self.val_transform = transforms.Compose([
             transforms.Resize((224, 224)),
-            transforms.ToTensor(),
-            transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
+            transforms.PILToTensor()
         ])
 
-    def load_data(self, csv_path: str, train_split: float = 0.8):
-        """Load NIH ChestX-ray14 dataset"""
-        logger.info("Loading dataset...")
+        # Tensor-native equivalents for the pre-resized uint8 cache
+        self.cached_train_transform = transforms.Compose([
+            transforms.RandomHorizontalFlip(),
+            transforms.RandomRotation(10),
+            transforms.ColorJitter(brightness=0.2, contrast=0.2)
+        ])
+
+        self.cached_val_transform = None
+
+        # ImageNet statistics scaled to the 0-255 uint8 range
+        self.norm_mean = torch.tensor(IMAGENET_MEAN, device=self.device).view(1, 3, 1, 1) * 255
+        self.norm_std = torch.tensor(IMAGENET_STD, device=self.device).view(1, 3, 1, 1) * 255
+
+    def normalize(self, images):
+        """Cast a uint8 batch to float and apply ImageNet normalization on its device"""
+        if images.dtype != torch.uint8:
+            return images  # DALI batches arrive already normalized
+        return images.float().sub_(self.norm_mean.to(images.device)).div_(self.norm_std.to(images.device))
 
+    def load_index(self, csv_path: str):
+        """Image paths and (N, C) one-hot labels for every image present on disk"""
         # Load CSV with image labels
         df = pd.read_csv(csv_path)
 
-        # Parse labels (multi-label classification)
-        image_paths = []
-        labels = []
+        # Keep rows whose image is on disk (one directory listing, not a stat per row)
+        image_dir = os.path.join(self.data_dir, 'images')
+        existing = set(os.listdir(image_dir))
+        df = df[df['Image Index'].isin(existing)].reset_index(drop=True)
 
-        for idx, row in df.iterrows():
-            image_path = os.path.join(self.data_dir, 'images', row['Image Index'])
-            if os.path.exists(image_path):
-                image_paths.append(image_path)
+        image_paths = (image_dir + os.sep + df['Image Index']).tolist()
 
-                # Parse finding labels
-                finding_labels = row['Finding Labels'].split('|')
-                label_vector = [1 if cls in finding_labels else 0 for cls in self.PATHOLOGY_CLASSES]
-                labels.append(label_vector)
+        # Parse labels (multi-label classification) into an (N, C) one-hot array
+        labels = (
+            df['Finding Labels'].str.get_dummies(sep='|')
+            .reindex(columns=self.PATHOLOGY_CLASSES, fill_value=0)
+            .to_numpy(dtype=np.float32)
+        )
+
+        return image_paths, labels
+
+    def prepare_cache(self, csv_path: str, cache_path: str):
+        """
+        Decode and resize every image once into a memory-mapped .npy cache
+
+        The cache holds an (N, 224, 224, 3) uint8 array in load_index order,
+        so training epochs skip PNG decoding entirely.
+        """
+        image_paths, _ = self.load_index(csv_path)
+        logger.info(f"Caching {len(image_paths)} images to {cache_path}...")
+
+        cache = np.lib.format.open_memmap(
+            cache_path, mode='w+', dtype=np.uint8,
+            shape=(len(image_paths), IMAGE_SIZE, IMAGE_SIZE, 3)
+        )
+        for i, image_path in enumerate(tqdm(image_paths, desc="Caching")):
+            image = Image.open(image_path).convert('RGB').resize((IMAGE_SIZE, IMAGE_SIZE), Image.BILINEAR)
+            cache[i] = np.asarray(image)
+
+        cache.flush()
+        del cache
+
+    def load_data(self, csv_path: str, train_split: float = 0.8, cache_path: str = None):
+        """Load NIH ChestX-ray14 dataset"""
+        logger.info("Loading dataset...")
+
+        image_paths, labels = self.load_index(csv_path)
 
         # Train/val split
-        train_paths, val_paths, train_labels, val_labels = train_test_split(
-            image_paths, labels, train_size=train_split, random_state=42
+        train_idx, val_idx = train_test_split(
+            np.arange(len(image_paths)), train_size=train_split, random_state=42
         )
+        train_labels, val_labels = labels[train_idx], labels[val_idx]
+        train_paths = [image_paths[i] for i in train_idx]
+        val_paths = [image_paths[i] for i in val_idx]
 
         logger.info(f"Training samples: {len(train_paths)}")
         logger.info(f"Validation samples: {len(val_paths)}")
 
+        if self.use_dali:
+            # DALI manages its own staging buffers; no workers or pinned memory
+            train_loader = DALIChestXrayLoader(train_paths, train_labels, self.batch_size, self.device, training=True)
+            val_loader = DALIChestXrayLoader(val_paths, val_labels, self.batch_size, self.device, training=False)
+            return train_loader, val_loader
+
         # Create datasets
-        train_dataset = ChestXrayDataset(train_paths, train_labels, self.train_transform)
-        val_dataset = ChestXrayDataset(val_paths, val_labels, self.val_transform)
+        if cache_path:
+            images = np.load(cache_path, mmap_mode='r')
+            if len(images) != len(image_paths):
+                raise ValueError(
+                    f"Image cache {cache_path} has {len(images)} images but the dataset has "
+                    f"{len(image_paths)}; rebuild it with prepare_cache"
+                )
+            train_dataset = CachedChestXrayDataset(images, train_idx, train_labels, self.cached_train_transform)
+            val_dataset = CachedChestXrayDataset(images, val_idx, val_labels, self.cached_val_transform)
+        else:
+            train_dataset = ChestXrayDataset(train_paths, train_labels, self.train_transform)
+            val_dataset = ChestXrayDataset(val_paths, val_labels, self.val_transform)
 
         # Create dataloaders
         train_loader = DataLoader(
             train_dataset,
             batch_size=self.batch_size,
             shuffle=True,
-            num_workers=4,
-            pin_memory=True
+            num_workers=self.num_workers,
+            pin_memory=True,
+            drop_last=True,
+            persistent_workers=self.num_workers > 0,
+            prefetch_factor=4 if self.num_workers > 0 else None
         )
 
         val_loader = DataLoader(
             val_dataset,
             batch_size=self.batch_size,
             shuffle=False,
-            num_workers=4,
-            pin_memory=True
+            num_workers=self.num_workers,
+            pin_memory=True,
+            persistent_workers=self.num_workers > 0,
+            prefetch_factor=4 if self.num_workers > 0 else None
         )
 
         return train_loader, val_loader
@@ -161,95 +458,166 @@ class ChestXrayTrainer:
         model.classifier = nn.Linear(num_features, len(self.PATHOLOGY_CLASSES))
 
         model = model.to(self.device)
+        # NHWC lets cuDNN pick Tensor Core conv kernels without layout transposes
+        model = model.to(memory_format=torch.channels_last)
+
+        # Inductor fuses the conv/BN/ReLU chain; shapes are static because
+        # the training loader drops the last partial batch. Compilation is
+        # deferred to the first forward pass, so its errors surface there;
+        # --no_compile trains in eager mode instead
+        if self.compile_model and self.device.type == 'cuda' and hasattr(torch, 'compile'):
+            model = torch.compile(model, mode='max-autotune', dynamic=False)
 
         return model
 
-    def train_epoch(self, model, train_loader, criterion, optimizer):
+    def quantize_model(self, state_dict, calibration_loader, num_batches: int = 4):
+        """
+        Post-training static int8 quantization of trained weights for CPU inference
+
+        Conv+BN+ReLU are fused by FX graph mode and calibrated on a few
+        batches; the fbgemm backend uses VNNI int8 kernels on x86.
+        """
+        from torch.ao.quantization import get_default_qconfig_mapping
+        from torch.ao.quantization.quantize_fx import prepare_fx, convert_fx
+
+        model = densenet121()
+        model.classifier = nn.Linear(model.classifier.in_features, len(self.PATHOLOGY_CLASSES))
+        model.load_state_dict(state_dict)
+        model.eval()
+
+        batches = iter(calibration_loader)
+        example_images = self.normalize(next(batches)[0].cpu()).contiguous()
+        prepared = prepare_fx(model, get_default_qconfig_mapping('fbgemm'), example_inputs=(example_images,))
+
+        with torch.no_grad():
+            prepared(example_images)
+            for _ in range(num_batches - 1):
+                images, _ = next(batches, (None, None))
+                if images is None:
+                    break
+                prepared(self.normalize(images.cpu()).contiguous())
+
+        quantized = convert_fx(prepared)
+        return torch.jit.trace(quantized, example_images)
+
+    def build_optimizer(self, model):
+        """Adam with a single fused (or multi-tensor) update kernel on CUDA"""
+        if self.device.type == 'cuda':
+            try:
+                return optim.Adam(model.parameters(), lr=self.learning_rate, fused=True)
+            except (TypeError, RuntimeError):
+                # Older PyTorch without fused Adam
+                return optim.Adam(model.parameters(), lr=self.learning_rate, foreach=True)
+
+        return optim.Adam(model.parameters(), lr=self.learning_rate)
+
+    def device_batches(self, loader):
+        """Overlap host-to-device copies with compute when loading from host memory"""
+        if self.device.type == 'cuda' and isinstance(loader, DataLoader):
+            return CUDAPrefetcher(loader, self.device)
+        return loader
+
+    def train_epoch(self, model, train_loader, criterion, optimizer, scaler):
         """Train for one epoch"""
         model.train()
-        total_loss = 0.0
+        # Accumulate on the device so the loop never blocks on a .item() sync
+        total_loss = torch.zeros((), device=self.device)
 
-        for images, labels in tqdm(train_loader, desc="Training"):
-            images = images.to(self.device)
-            labels = labels.to(self.device)
+        # Step the optimizer every grad_accum_steps micro-batches, and after the last one
+        num_batches = len(train_loader)
+        optimizer.zero_grad(set_to_none=True)
+
+        for step, (images, labels) in enumerate(tqdm(self.device_batches(train_loader), desc="Training", mininterval=1.0)):
+            images = images.to(self.device, non_blocking=True).to(memory_format=torch.channels_last)
+            images = self.normalize(images)
+            labels = labels.to(self.device, non_blocking=True)
 
             # Forward pass
-            optimizer.zero_grad()
-            outputs = model(images)
-            loss = criterion(outputs, labels)
+            with torch.autocast(device_type=self.device.type, dtype=self.amp_dtype, enabled=self.use_amp):
+                outputs = model(images)
+                loss = criterion(outputs, labels)
 
             # Backward pass
-            loss.backward()
-            optimizer.step()
+            scaler.scale(loss / self.grad_accum_steps).backward()
+            if (step + 1) % self.grad_accum_steps == 0 or step + 1 == num_batches:
+                scaler.step(optimizer)
+                scaler.update()
+                optimizer.zero_grad(set_to_none=True)
 
-            total_loss += loss.item()
+            total_loss += loss.detach()
 
-        avg_loss = total_loss / len(train_loader)
+        avg_loss = (total_loss / len(train_loader)).item()
         return avg_loss
 
     def validate(self, model, val_loader, criterion):
         """Validate model"""
         model.eval()
-        total_loss = 0.0
-        all_labels = []
-        all_predictions = []
+        total_loss = torch.zeros((), device=self.device)
+
+        # Preallocate (N, C) outputs on the device and fill by offset
+        num_samples = len(val_loader.dataset) if hasattr(val_loader, 'dataset') else val_loader.num_samples
+        all_labels = torch.empty((num_samples, len(self.PATHOLOGY_CLASSES)), dtype=torch.float32, device=self.device)
+        all_predictions = torch.empty_like(all_labels)
+        offset = 0
 
         with torch.no_grad():
-            for images, labels in tqdm(val_loader, desc="Validation"):
-                images = images.to(self.device)
-                labels = labels.to(self.device)
+            for images, labels in tqdm(self.device_batches(val_loader), desc="Validation", mininterval=1.0):
+                images = images.to(self.device, non_blocking=True).to(memory_format=torch.channels_last)
+                images = self.normalize(images)
+                labels = labels.to(self.device, non_blocking=True)
 
-                outputs = model(images)
-                loss = criterion(outputs, labels)
+                with torch.autocast(device_type=self.device.type, dtype=self.amp_dtype, enabled=self.use_amp):
+                    outputs = model(images)
+                    loss = criterion(outputs, labels)
 
-                total_loss += loss.item()
+                total_loss += loss.detach()
 
                 # Sigmoid for probabilities
-                probs = torch.sigmoid(outputs)
+                probs = torch.sigmoid(outputs.float())
 
-                all_labels.append(labels.cpu().numpy())
-                all_predictions.append(probs.cpu().numpy())
+                batch_size = labels.shape[0]
+                all_labels[offset:offset + batch_size] = labels
+                all_predictions[offset:offset + batch_size] = probs
+                offset += batch_size
 
-        avg_loss = total_loss / len(val_loader)
+        avg_loss = (total_loss / len(val_loader)).item()
 
-        # Concatenate all batches
-        all_labels = np.vstack(all_labels)
-        all_predictions = np.vstack(all_predictions)
-
-        # Calculate AUC-ROC per class
-        auc_scores = []
-        for i in range(len(self.PATHOLOGY_CLASSES)):
-            try:
-                auc = roc_auc_score(all_labels[:, i], all_predictions[:, i])
-                auc_scores.append(auc)
-            except:
-                auc_scores.append(0.0)
+        # Calculate AUC-ROC per class on the device; only C floats come back
+        auc_scores = rank_sum_auc(all_labels[:offset], all_predictions[:offset]).cpu().tolist()
 
         mean_auc = np.mean(auc_scores)
 
         return avg_loss, mean_auc, auc_scores
 
-    def train(self, csv_path: str):
+    def train(self, csv_path: str, cache_path: str = None):
         """Full training pipeline"""
         logger.info("="*60)
         logger.info("Chest X-ray Classifier Training")
         logger.info("="*60)
 
         # Load data
-        train_loader, val_loader = self.load_data(csv_path)
+        train_loader, val_loader = self.load_data(csv_path, cache_path=cache_path)
 
         # Build model
         model = self.build_model()
+        # Save the underlying module's weights so checkpoints load without torch.compile
+        eager_model = getattr(model, '_orig_mod', model)
 
         # Loss and optimizer
         criterion = nn.BCEWithLogitsLoss()
-        optimizer = optim.Adam(model.parameters(), lr=self.learning_rate)
+        optimizer = self.build_optimizer(model)
+        scaler = torch.cuda.amp.GradScaler(enabled=self.use_amp and self.amp_dtype == torch.float16)
 
         # Learning rate scheduler
         scheduler = optim.lr_scheduler.ReduceLROnPlateau(
             optimizer, mode='max', patience=5, factor=0.5
         )
 
+        # Checkpoints are written on a background thread; a single worker
+        # keeps saves and rotations in submission order
+        save_executor = ThreadPoolExecutor(max_workers=1)
+        save_futures = []
+
         # Training loop
         best_auc = 0.0
         training_history = []
@@ -258,7 +626,7 @@ class ChestXrayTrainer:
             logger.info(f"\nEpoch {epoch+1}/{self.num_epochs}")
 
             # Train
-            train_loss = self.train_epoch(model, train_loader, criterion, optimizer)
+            train_loss = self.train_epoch(model, train_loader, criterion, optimizer, scaler)
 
             # Validate
             val_loss, mean_auc, auc_scores = self.validate(model, val_loader, criterion)
@@ -285,7 +653,7 @@ class ChestXrayTrainer:
             if mean_auc > best_auc:
                 best_auc = mean_auc
                 model_path = os.path.join(self.output_dir, 'best_model.pth')
-                torch.save(model.state_dict(), model_path)
+                save_futures.append(save_executor.submit(torch.save, cpu_state_copy(eager_model.state_dict()), model_path))
                 logger.info(f"✓ Saved best model (AUC: {best_auc:.4f})")
 
             # Learning rate scheduling
@@ -293,17 +661,43 @@ class ChestXrayTrainer:
 
             # Save checkpoint
             checkpoint_path = os.path.join(self.output_dir, f'checkpoint_epoch_{epoch+1}.pth')
-            torch.save({
+            save_futures.append(save_executor.submit(torch.save, {
                 'epoch': epoch + 1,
-                'model_state_dict': model.state_dict(),
-                'optimizer_state_dict': optimizer.state_dict(),
+                'model_state_dict': cpu_state_copy(eager_model.state_dict()),
+                'optimizer_state_dict': cpu_state_copy(optimizer.state_dict()),
                 'mean_auc': mean_auc,
-            }, checkpoint_path)
+            }, checkpoint_path))
+
+            # Keep only the most recent checkpoints
+            stale_epoch = epoch + 1 - self.keep_checkpoints
+            if stale_epoch >= 1:
+                stale_path = os.path.join(self.output_dir, f'checkpoint_epoch_{stale_epoch}.pth')
+                save_futures.append(save_executor.submit(remove_if_exists, stale_path))
+
+        # Wait for pending saves and surface any write errors
+        save_executor.shutdown(wait=True)
+        for future in save_futures:
+            future.result()
+
+        # Export an int8 copy of the best model for deployment
+        best_model_path = os.path.join(self.output_dir, 'best_model.pth')
+        if self.quantize and os.path.exists(best_model_path):
+            try:
+                quantized = self.quantize_model(torch.load(best_model_path, map_location='cpu'), val_loader)
+                quantized_path = os.path.join(self.output_dir, 'best_model_int8.pt')
+                torch.jit.save(quantized, quantized_path)
+                logger.info(f"✓ Saved int8 quantized model to {quantized_path}")
+            except Exception as e:
+                logger.warning(f"int8 quantization failed, keeping FP32 model only: {e}")
 
         # Save training history
         history_path = os.path.join(self.output_dir, 'training_history.json')
-        with open(history_path, 'w') as f:
-            json.dump(training_history, f, indent=2)
+        if orjson is not None:
+            with open(history_path, 'wb') as f:
+                f.write(orjson.dumps(training_history, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(history_path, 'w') as f:
+                json.dump(training_history, f, indent=2)
 
         logger.info("\n" + "="*60)
         logger.info(f"Training Complete! Best AUC: {best_auc:.4f}")
@@ -322,6 +716,13 @@ if __name__ == "__main__":
     parser.add_argument("--batch_size", type=int, default=32)
     parser.add_argument("--num_epochs", type=int, default=50)
     parser.add_argument("--learning_rate", type=float, default=1e-4)
+    parser.add_argument("--grad_accum_steps", type=int, default=1, help="Micro-batches per optimizer step")
+    parser.add_argument("--num_workers", type=int, default=None, help="DataLoader workers (default: half the CPU cores, at least 4)")
+    parser.add_argument("--quantize", action="store_true", help="Export an int8 quantized copy of the best model")
+    parser.add_argument("--no_compile", action="store_true", help="Disable torch.compile and train in eager mode")
+    parser.add_argument("--keep_checkpoints", type=int, default=3, help="Number of recent epoch checkpoints to keep")
+    parser.add_argument("--cache_path", help="Pre-decoded image cache (.npy); built on first use if missing")
+    parser.add_argument("--use_dali", action="store_true", help="Decode and augment images on the GPU with NVIDIA DALI")
 
     args = parser.parse_args()
 
@@ -330,7 +731,16 @@ if __name__ == "__main__":
         output_dir=args.output_dir,
         batch_size=args.batch_size,
         num_epochs=args.num_epochs,
-        learning_rate=args.learning_rate
+        learning_rate=args.learning_rate,
+        grad_accum_steps=args.grad_accum_steps,
+        use_dali=args.use_dali,
+        keep_checkpoints=args.keep_checkpoints,
+        compile_model=not args.no_compile,
+        quantize=args.quantize,
+        num_workers=args.num_workers
     )
 
-    trainer.train(args.csv_path)
+    if args.cache_path and not args.use_dali and not os.path.exists(args.cache_path):
+        trainer.prepare_cache(args.csv_path, args.cache_path)
+
+    trainer.train(args.csv_path, cache_path=args.cache_path)
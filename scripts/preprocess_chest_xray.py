@@ -5,7 +5,7 @@ This script preprocesses the NIH ChestX-ray14 dataset for model training:
 1. Load metadata and images
 2. Normalize pixel values
 3. Resize to target dimensions
-4. Apply data augmentation
+4. Record the training-time augmentation spec
 5. Split into train/val/test sets
 6. Save processed data
 
@@ -19,12 +19,13 @@ Usage:
 import os
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 import numpy as np
 from pathlib import Path
 from tqdm import tqdm
 import logging
-from typing import Tuple, List, Dict
+from typing import Tuple, Dict, Iterable, Optional
 import json
 
 # Image processing
@@ -36,6 +37,12 @@ except ImportError:
     print("Install with: pip install pillow opencv-python pandas tqdm")
     sys.exit(1)
 
+# Optional single-file image store
+try:
+    import lmdb
+except ImportError:
+    lmdb = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -43,6 +50,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-process preprocessor used by the worker pool
+_worker_preprocessor = None
+
 
 class ChestXrayPreprocessor:
     """Preprocessor for NIH ChestX-ray14 dataset"""
@@ -55,7 +65,16 @@ class ChestXrayPreprocessor:
         'Pleural_Thickening', 'Hernia'
     ]
 
-    def __init__(self, data_dir: str, output_dir: str, image_size: int = 224):
+    # Normalized intensities carry ~8 bits of information; float16 halves
+    # disk and loader bandwidth against float32
+    OUTPUT_DTYPE = np.float16
+
+    # Augmentation parameters; written to the config for the training
+    # data loader to apply
+    ROTATION_ANGLES = [-10, 10]
+    BRIGHTNESS_FACTORS = [0.9, 1.1]
+
+    def __init__(self, data_dir: str, output_dir: str, image_size: int = 224, lmdb_path: Optional[str] = None):
         """
         Initialize preprocessor
 
@@ -63,10 +82,15 @@ class ChestXrayPreprocessor:
             data_dir: Path to raw data directory
             output_dir: Path to output processed data
             image_size: Target image size (default: 224x224)
+            lmdb_path: LMDB store of the raw PNGs to read instead of the
+                image files (built by prepare_lmdb if missing)
         """
         self.data_dir = Path(data_dir)
         self.output_dir = Path(output_dir)
         self.image_size = image_size
+        self.lmdb_path = Path(lmdb_path) if lmdb_path else None
+        self._lmdb_env = None
+        self._size = (image_size, image_size)
 
         # Create output directories
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -78,6 +102,9 @@ class ChestXrayPreprocessor:
         self.metadata_df = None
         self.bbox_df = None
 
+        # Memory-mapped per-split image arrays opened by this process
+        self._split_arrays = {}
+
     def load_metadata(self):
         """Load dataset metadata"""
         logger.info("Loading metadata...")
@@ -96,130 +123,240 @@ class ChestXrayPreprocessor:
             logger.info(f"Loaded {len(self.bbox_df)} bounding box annotations")
 
         # Parse labels
-        self.metadata_df['labels'] = self.metadata_df['Finding Labels'].apply(
-            lambda x: x.split('|') if x != 'No Finding' else ['No Finding']
+        self.metadata_df['labels'] = self.metadata_df['Finding Labels'].str.split('|')
+
+        # Create binary label columns in one vectorized one-hot pass; labels
+        # absent from this metadata still get an all-zero column
+        label_columns = self.metadata_df['Finding Labels'].str.get_dummies(sep='|')
+        self.metadata_df = pd.concat(
+            [self.metadata_df, label_columns.reindex(columns=self.DISEASE_LABELS, fill_value=0)],
+            axis=1
         )
 
-        # Create binary label columns
-        for label in self.DISEASE_LABELS:
-            self.metadata_df[label] = self.metadata_df['labels'].apply(
-                lambda x: 1 if label in x else 0
-            )
-
         logger.info("Metadata loaded successfully")
 
-    def normalize_image(self, image: np.ndarray) -> np.ndarray:
+    def prepare_lmdb(self, image_names: Iterable[str]):
         """
-        Normalize image to [0, 1] range
+        Pack the raw PNG bytes into one LMDB store keyed by image name
+
+        Reading many small PNGs costs a directory lookup and open per file;
+        the store turns that into reads from a single memory-mapped file.
 
         Args:
-            image: Input image array
+            image_names: Image file names to pack
+        """
+        if lmdb is None:
+            raise ImportError("LMDB input requires the lmdb package: pip install lmdb")
+
+        image_paths = [self.data_dir / 'images' / name for name in sorted(set(image_names))]
+        image_paths = [path for path in image_paths if path.exists()]
+        map_size = sum(path.stat().st_size for path in image_paths) * 2 + (1 << 20)
+
+        logger.info(f"Packing {len(image_paths)} images into {self.lmdb_path}...")
+        env = lmdb.open(str(self.lmdb_path), map_size=map_size)
+        try:
+            for start in tqdm(range(0, len(image_paths), 1000)):
+                with env.begin(write=True) as txn:
+                    for path in image_paths[start:start + 1000]:
+                        txn.put(path.name.encode(), path.read_bytes())
+        finally:
+            env.close()
+
+    def read_image(self, image_path: Path) -> Optional[np.ndarray]:
+        """
+        Load a grayscale image from the LMDB store if configured, else from disk
+
+        Args:
+            image_path: Path to image file
 
         Returns:
-            Normalized image
+            uint8 image, or None if it cannot be loaded
         """
-        image = image.astype(np.float32)
-        image = (image - image.min()) / (image.max() - image.min() + 1e-8)
-        return image
+        if self.lmdb_path is None:
+            return cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
 
-    def resize_image(self, image: np.ndarray) -> np.ndarray:
+        # Opened lazily so each worker process maps the store itself
+        if self._lmdb_env is None:
+            self._lmdb_env = lmdb.open(str(self.lmdb_path), readonly=True, lock=False)
+
+        with self._lmdb_env.begin(buffers=True) as txn:
+            data = txn.get(image_path.name.encode())
+            if data is None:
+                return None
+            return cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_GRAYSCALE)
+
+    def normalization_lut(self, image: np.ndarray) -> np.ndarray:
         """
-        Resize image to target size
+        Build the lookup table that min/max-normalizes a uint8 image
 
         Args:
-            image: Input image array
+            image: Input uint8 image
 
         Returns:
-            Resized image
+            256-entry float32 table mapping [min, max] to [0, 1]
         """
-        return cv2.resize(image, (self.image_size, self.image_size))
+        img_min, img_max = int(image.min()), int(image.max())
+        return (np.arange(256, dtype=np.float32) - img_min) / max(img_max - img_min, 1)
 
-    def augment_image(self, image: np.ndarray) -> List[np.ndarray]:
+    def normalize_image(self, image: np.ndarray, lut: np.ndarray = None) -> np.ndarray:
         """
-        Apply data augmentation
+        Normalize image to [0, 1] range
 
         Args:
-            image: Input image array
+            image: Input uint8 image
+            lut: Normalization table (default: built from this image)
 
         Returns:
-            List of augmented images
+            Normalized float32 image
         """
-        augmented = [image]  # Original
+        if lut is None:
+            lut = self.normalization_lut(image)
 
-        # Horizontal flip
-        augmented.append(cv2.flip(image, 1))
+        # One table lookup per pixel, widening uint8 to float32 in the same pass
+        return cv2.LUT(image, lut)
 
-        # Rotation (small angles)
-        for angle in [-10, 10]:
-            M = cv2.getRotationMatrix2D(
-                (self.image_size // 2, self.image_size // 2),
-                angle,
-                1.0
-            )
-            rotated = cv2.warpAffine(image, M, (self.image_size, self.image_size))
-            augmented.append(rotated)
+    def resize_image(self, image: np.ndarray) -> np.ndarray:
+        """
+        Resize image to target size
 
-        # Brightness adjustment
-        for factor in [0.9, 1.1]:
-            adjusted = np.clip(image * factor, 0, 1)
-            augmented.append(adjusted)
+        Args:
+            image: Input image array
 
-        return augmented
+        Returns:
+            Resized image
+        """
+        return cv2.resize(image, self._size)
 
-    def process_image(
-        self,
-        image_path: Path,
-        augment: bool = False
-    ) -> Tuple[List[np.ndarray], bool]:
+    def process_image(self, image_path: Path) -> Tuple[Optional[np.ndarray], bool]:
         """
         Process single image
 
         Args:
             image_path: Path to image file
-            augment: Whether to apply augmentation
 
         Returns:
-            Tuple of (processed images list, success flag)
+            Tuple of (processed image, success flag)
         """
         try:
             # Load image
-            image = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+            image = self.read_image(image_path)
 
             if image is None:
                 logger.warning(f"Failed to load image: {image_path}")
-                return [], False
+                return None, False
 
             # Resize
             image = self.resize_image(image)
 
             # Normalize
-            image = self.normalize_image(image)
-
-            # Augment
-            if augment:
-                images = self.augment_image(image)
-            else:
-                images = [image]
-
-            return images, True
+            return self.normalize_image(image), True
 
         except Exception as e:
             logger.error(f"Error processing {image_path}: {str(e)}")
-            return [], False
+            return None, False
+
+    def split_array(self, split_name: str) -> np.ndarray:
+        """
+        Memory-mapped image array of a split, opened once per process
+
+        Args:
+            split_name: Split name (train/val/test)
+
+        Returns:
+            Writable (N, H, W) memmap over the split's images.npy
+        """
+        if split_name not in self._split_arrays:
+            self._split_arrays[split_name] = np.lib.format.open_memmap(
+                self.output_dir / split_name / 'images.npy', mode='r+'
+            )
+        return self._split_arrays[split_name]
+
+    def process_and_save(self, image_name: str, split_name: str, offset: int) -> bool:
+        """
+        Process one image and write it into the split's image array
+
+        Args:
+            image_name: Image file name from the metadata
+            split_name: Split to save into (train/val/test)
+            offset: Row of the split array reserved for this image
+
+        Returns:
+            True if the image was processed and saved
+        """
+        image_path = self.data_dir / 'images' / image_name
+
+        if self.lmdb_path is None and not image_path.exists():
+            logger.warning(f"Image not found: {image_path}")
+            return False
+
+        # Process image
+        image, success = self.process_image(image_path)
+
+        if not success:
+            return False
+
+        # Write the processed image into its reserved row
+        self.split_array(split_name)[offset] = image
+
+        return True
+
+    def split_indices(
+        self,
+        train_ratio: float,
+        val_ratio: float,
+        seed: int
+    ) -> Dict[str, np.ndarray]:
+        """
+        Assign metadata rows to splits by patient
+
+        Patients are shuffled and whole patients are assigned to train, then
+        val, then test until each split reaches its share of images, so no
+        patient appears in two splits.
+
+        Args:
+            train_ratio: Training set ratio
+            val_ratio: Validation set ratio
+            seed: Shuffle seed
+
+        Returns:
+            Dictionary with train/val/test row index arrays
+        """
+        patient_codes, patients = pd.factorize(self.metadata_df['Patient ID'])
+        rng = np.random.default_rng(seed)
+
+        # Position of every patient in the shuffled order, and each row's position
+        patient_rank = np.empty(len(patients), dtype=np.int64)
+        patient_rank[rng.permutation(len(patients))] = np.arange(len(patients))
+        row_order = np.argsort(patient_rank[patient_codes], kind='stable')
+
+        # Cut at the first patient boundary at or past each split's share of images
+        n = len(self.metadata_df)
+        boundaries = np.concatenate(([0], np.cumsum(np.bincount(patient_rank[patient_codes]))))
+        train_end, val_end = boundaries[np.searchsorted(
+            boundaries, [n * train_ratio, n * (train_ratio + val_ratio)]
+        )]
+
+        return {
+            'train': row_order[:train_end],
+            'val': row_order[train_end:val_end],
+            'test': row_order[val_end:]
+        }
 
     def split_dataset(
         self,
         train_ratio: float = 0.7,
         val_ratio: float = 0.15,
-        test_ratio: float = 0.15
+        test_ratio: float = 0.15,
+        seed: int = 42
     ) -> Dict[str, pd.DataFrame]:
         """
-        Split dataset into train/val/test
+        Split dataset into train/val/test without patient overlap
 
         Args:
             train_ratio: Training set ratio
             val_ratio: Validation set ratio
             test_ratio: Test set ratio
+            seed: Shuffle seed
 
         Returns:
             Dictionary with train/val/test DataFrames
@@ -227,18 +364,21 @@ class ChestXrayPreprocessor:
         assert abs(train_ratio + val_ratio + test_ratio - 1.0) < 1e-6, \
             "Ratios must sum to 1.0"
 
-        # Shuffle dataset
-        df = self.metadata_df.sample(frac=1, random_state=42).reset_index(drop=True)
+        # Index arrays are cached per (ratios, seed); reruns skip the split
+        cache_path = self.output_dir / f'split_indices_{train_ratio}_{val_ratio}_{test_ratio}_{seed}.npz'
+        indices = None
+        if cache_path.exists():
+            with np.load(cache_path) as cached:
+                if int(cached['num_rows']) == len(self.metadata_df):
+                    indices = {name: cached[name] for name in ('train', 'val', 'test')}
 
-        # Calculate split indices
-        n = len(df)
-        train_end = int(n * train_ratio)
-        val_end = train_end + int(n * val_ratio)
+        if indices is None:
+            indices = self.split_indices(train_ratio, val_ratio, seed)
+            np.savez(cache_path, num_rows=len(self.metadata_df), **indices)
 
         splits = {
-            'train': df[:train_end],
-            'val': df[train_end:val_end],
-            'test': df[val_end:]
+            name: self.metadata_df.iloc[rows].reset_index(drop=True)
+            for name, rows in indices.items()
         }
 
         logger.info(f"Dataset split: train={len(splits['train'])}, "
@@ -251,7 +391,8 @@ class ChestXrayPreprocessor:
         augment_train: bool = True,
         train_ratio: float = 0.7,
         val_ratio: float = 0.15,
-        test_ratio: float = 0.15
+        test_ratio: float = 0.15,
+        num_workers: int = None
     ):
         """
         Process entire dataset
@@ -261,6 +402,7 @@ class ChestXrayPreprocessor:
             train_ratio: Training set ratio
             val_ratio: Validation set ratio
             test_ratio: Test set ratio
+            num_workers: Worker processes (default: one per CPU)
         """
         # Load metadata
         self.load_metadata()
@@ -268,54 +410,67 @@ class ChestXrayPreprocessor:
         # Split dataset
         splits = self.split_dataset(train_ratio, val_ratio, test_ratio)
 
-        # Process each split
-        for split_name, split_df in splits.items():
-            logger.info(f"Processing {split_name} set...")
-
-            augment = augment_train and (split_name == 'train')
-
-            processed_count = 0
-            failed_count = 0
-
-            for idx, row in tqdm(split_df.iterrows(), total=len(split_df)):
-                image_name = row['Image Index']
-                image_path = self.data_dir / 'images' / image_name
-
-                if not image_path.exists():
-                    logger.warning(f"Image not found: {image_path}")
-                    failed_count += 1
-                    continue
-
-                # Process image
-                images, success = self.process_image(image_path, augment)
-
-                if not success:
-                    failed_count += 1
-                    continue
-
-                # Save processed images
-                for i, img in enumerate(images):
-                    suffix = f"_aug{i}" if i > 0 else ""
-                    output_path = self.output_dir / split_name / f"{image_name.replace('.png', '')}{suffix}.npy"
-                    np.save(output_path, img)
-
-                processed_count += 1
-
-            logger.info(f"{split_name}: Processed {processed_count} images, "
-                       f"Failed {failed_count}")
-
-            # Save split metadata
-            metadata_path = self.output_dir / split_name / 'metadata.csv'
-            split_df.to_csv(metadata_path, index=False)
+        if self.lmdb_path is not None and not self.lmdb_path.exists():
+            self.prepare_lmdb(self.metadata_df['Image Index'])
+
+        # Process each split; images are independent, so each worker loads,
+        # transforms and saves its own and only names and flags are pickled
+        with ProcessPoolExecutor(
+            max_workers=num_workers or os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(str(self.data_dir), str(self.output_dir), self.image_size, self.lmdb_path)
+        ) as executor:
+            for split_name, split_df in splits.items():
+                logger.info(f"Processing {split_name} set...")
+
+                # One contiguous (N, H, W) array per split instead of a file
+                # per image; workers write their rows in place
+                np.lib.format.open_memmap(
+                    self.output_dir / split_name / 'images.npy',
+                    mode='w+',
+                    dtype=self.OUTPUT_DTYPE,
+                    shape=(len(split_df), self.image_size, self.image_size)
+                ).flush()
+
+                tasks = [
+                    (image_name, split_name, position)
+                    for position, image_name in enumerate(split_df['Image Index'].to_numpy())
+                ]
+                results = list(tqdm(executor.map(_process_one, tasks, chunksize=64), total=len(tasks)))
+
+                processed_count = sum(results)
+                failed_count = len(results) - processed_count
+
+                # Index of the rows that hold images; rows of failed images stay zero
+                index_df = pd.DataFrame(
+                    [(image_name, offset) for (image_name, _, offset), success in zip(tasks, results) if success],
+                    columns=['Image Index', 'offset']
+                )
+                index_df.to_csv(self.output_dir / split_name / 'index.csv', index=False)
+
+                logger.info(f"{split_name}: Processed {processed_count} images, "
+                           f"Failed {failed_count}")
+
+                # Save split metadata
+                metadata_path = self.output_dir / split_name / 'metadata.csv'
+                split_df.to_csv(metadata_path, index=False)
 
         # Save preprocessing config
         config = {
             'image_size': self.image_size,
+            'dtype': np.dtype(self.OUTPUT_DTYPE).name,
             'disease_labels': self.DISEASE_LABELS,
             'train_ratio': train_ratio,
             'val_ratio': val_ratio,
             'test_ratio': test_ratio,
-            'augment_train': augment_train
+            'augment_train': augment_train,
+            # Training-time augmentation for the train split; nothing is
+            # precomputed, so each epoch can draw fresh variants
+            'augmentation': {
+                'horizontal_flip': True,
+                'rotation_angles': self.ROTATION_ANGLES,
+                'brightness_factors': self.BRIGHTNESS_FACTORS
+            } if augment_train else None
         }
 
         config_path = self.output_dir / 'preprocessing_config.json'
@@ -325,6 +480,18 @@ class ChestXrayPreprocessor:
         logger.info(f"Preprocessing complete! Config saved to {config_path}")
 
 
+def _init_worker(data_dir: str, output_dir: str, image_size: int, lmdb_path: Optional[Path]):
+    """Pool initializer: one single-threaded OpenCV preprocessor per process"""
+    global _worker_preprocessor
+    cv2.setNumThreads(1)
+    _worker_preprocessor = ChestXrayPreprocessor(data_dir, output_dir, image_size, lmdb_path)
+
+
+def _process_one(task: Tuple[str, str, int]) -> bool:
+    """Pool task: process and save one image, returning whether it succeeded"""
+    return _worker_preprocessor.process_and_save(*task)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Preprocess NIH ChestX-ray14 dataset"
@@ -350,7 +517,8 @@ def main():
     parser.add_argument(
         '--augment',
         action='store_true',
-        help='Apply data augmentation to training set'
+        help='Record a training-time augmentation spec in preprocessing_config.json '
+             '(only written; no loader in this repo applies it yet)'
     )
     parser.add_argument(
         '--train_ratio',
@@ -370,6 +538,18 @@ def main():
         default=0.15,
         help='Test set ratio (default: 0.15)'
     )
+    parser.add_argument(
+        '--num_workers',
+        type=int,
+        default=None,
+        help='Worker processes (default: one per CPU)'
+    )
+    parser.add_argument(
+        '--lmdb_path',
+        type=str,
+        default=None,
+        help='Read images from this LMDB store, packing it from the PNGs first if missing'
+    )
 
     args = parser.parse_args()
 
@@ -377,7 +557,8 @@ def main():
     preprocessor = ChestXrayPreprocessor(
         data_dir=args.data_dir,
         output_dir=args.output_dir,
-        image_size=args.image_size
+        image_size=args.image_size,
+        lmdb_path=args.lmdb_path
     )
 
     # Process dataset
@@ -385,7 +566,8 @@ def main():
         augment_train=args.augment,
         train_ratio=args.train_ratio,
         val_ratio=args.val_ratio,
-        test_ratio=args.test_ratio
+        test_ratio=args.test_ratio,
+        num_workers=args.num_workers
     )
 
     logger.info("All done!")
@@ -14,15 +14,33 @@ Usage:
 """
 
 import os
-import sys
 import argparse
+import functools
 from pathlib import Path
 import pandas as pd
 import numpy as np
 import json
-from typing import Dict, List
+from typing import Dict, List, Callable, Sequence, Optional, Tuple, Iterator
 import logging
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
 
 # Configure logging
 logging.basicConfig(
@@ -31,20 +49,209 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# stat() calls are latency-bound, so many can be in flight at once
+STAT_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Below this many files the pool costs more than it saves
+PARALLEL_STAT_THRESHOLD = 64
+
+
+def _parallel_map(func: Callable, items: Sequence, threshold: int = PARALLEL_STAT_THRESHOLD) -> List:
+    """
+    Apply a filesystem metadata call to every item, in a thread pool for large inputs
+
+    Args:
+        func: Function to apply (e.g. a stat or existence check)
+        items: Items to apply it to
+        threshold: Minimum number of items worth a thread pool
+
+    Returns:
+        Results in input order
+    """
+    if len(items) < threshold:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=STAT_WORKERS) as executor:
+        return list(executor.map(func, items))
+
+
+def _file_size(entry: os.DirEntry) -> int:
+    """Size of a directory entry, following symlinks like Path.stat()"""
+    return entry.stat().st_size
+
+
+# Files every complete KiTS19 case directory holds
+KITS_CASE_FILES = {'imaging.nii.gz', 'segmentation.nii.gz'}
+
+
+def _kits_case_complete(case_dir: Path) -> bool:
+    """Whether a KiTS19 case directory holds both its imaging and segmentation files"""
+    # One directory read answers both checks
+    with os.scandir(case_dir) as entries:
+        names = {entry.name for entry in entries if entry.is_file()}
+    return KITS_CASE_FILES <= names
+
+
+def _walk_limited(root: Path, max_depth: int) -> Iterator[Tuple[str, List[str], List[str]]]:
+    """
+    Top-down os.walk() that stops descending max_depth levels below root
+
+    Callers may prune the yielded dirnames further, as with os.walk().
+
+    Args:
+        root: Directory to walk
+        max_depth: Deepest level whose directories are listed (root is 0)
+
+    Yields:
+        (dirpath, dirnames, filenames) tuples
+    """
+    root = os.fspath(root)
+    root_depth = root.rstrip(os.sep).count(os.sep)
+
+    # Dataset directories are often symlinked in; the depth limit rules out cycles
+    for dirpath, dirnames, filenames in os.walk(root, topdown=True, followlinks=True):
+        if dirpath.count(os.sep) - root_depth >= max_depth:
+            dirnames[:] = []
+        yield dirpath, dirnames, filenames
+
+
+def _write_file(path: str, payload: bytes):
+    """
+    Write a file with as few write() calls as the kernel allows, then fsync it
+
+    Args:
+        path: Output file path
+        payload: Full file contents
+    """
+    # O_CLOEXEC keeps the fd out of any child process; it is POSIX-only
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o644)
+    try:
+        view = memoryview(payload)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+# Cached sub-reports are recomputed after a day even if nothing changed
+REPORT_CACHE_TTL = 86400
+
+
+def cached_report(inputs_method: str):
+    """
+    Serve a validator's sub-report from the report cache while the paths it reads are unchanged
+
+    Args:
+        inputs_method: Name of the validator method listing every file and
+            directory the sub-report is computed from; their mtimes and sizes
+            key the cache entry
+    """
+    def decorator(validate):
+        @functools.wraps(validate)
+        def wrapper(self) -> Dict:
+            if self.report_cache is None:
+                return validate(self)
+
+            # Reports embed data_dir as given, so key on that as well as its resolved path
+            key = (validate.__name__, str(self.data_dir), str(self.data_dir.resolve()), self._fingerprint(getattr(self, inputs_method)()))
+            report = self.report_cache.get(key)
+            if report is not None:
+                logger.info(f"[cached] {validate.__name__}")
+                return report
+
+            report = validate(self)
+            self.report_cache.set(key, report, expire=REPORT_CACHE_TTL)
+            return report
+        return wrapper
+    return decorator
+
 
 class DatasetValidator:
     """Validator for medical imaging datasets"""
 
-    def __init__(self, data_dir: str):
+    def __init__(self, data_dir: str, cache_dir: Optional[str] = None):
         """
         Initialize validator
 
         Args:
             data_dir: Path to data directory
+            cache_dir: Directory caching sub-reports across runs (None disables caching)
         """
         self.data_dir = Path(data_dir)
         self.report = {}
 
+        # Directory listings read during the current report, keyed by path
+        self._dir_cache: Dict[str, List[Tuple[str, bool, bool]]] = {}
+
+        if cache_dir is not None and Cache is None:
+            logger.warning("diskcache not installed, validating without the report cache")
+            cache_dir = None
+        self.cache_dir = cache_dir
+        self._report_cache = None
+
+    @property
+    def report_cache(self) -> Optional['Cache']:
+        """Sub-report cache, opened on first use"""
+        if self.cache_dir is not None and self._report_cache is None:
+            self._report_cache = Cache(os.path.expanduser(self.cache_dir))
+        return self._report_cache
+
+    def _listdir(self, directory: Path) -> List[Tuple[str, bool, bool]]:
+        """
+        List a directory once per report
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            (name, is_dir, is_file) for each entry; empty if the directory is missing
+        """
+        key = str(directory)
+        listing = self._dir_cache.get(key)
+        if listing is None:
+            try:
+                with os.scandir(directory) as entries:
+                    listing = [(entry.name, entry.is_dir(), entry.is_file()) for entry in entries]
+            except (FileNotFoundError, NotADirectoryError):
+                listing = []
+            self._dir_cache[key] = listing
+        return listing
+
+    def _children(self, directory: Path) -> set:
+        """Names in a directory (empty if it is missing), so sibling checks share one listing"""
+        return {name for name, _, _ in self._listdir(directory)}
+
+    def _fingerprint(self, paths: Sequence[Path]) -> Tuple:
+        """
+        Modification time and size of each path, None for missing ones
+
+        Adding or removing files changes the mtime of their directory, so
+        given every directory a validator lists (nested ones included), this
+        covers all of its listings without reading them again.
+        """
+        fingerprint = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+                fingerprint.append((st.st_mtime_ns, st.st_size))
+            except FileNotFoundError:
+                fingerprint.append(None)
+        return tuple(fingerprint)
+
+    def _chest_xray_inputs(self) -> List[Path]:
+        """Files and directories validate_chest_xray reads"""
+        chest_xray_dir = self.data_dir / 'raw' / 'chest-xray'
+        return [
+            chest_xray_dir,
+            chest_xray_dir / 'Data_Entry_2017.csv',
+            chest_xray_dir / 'BBox_List_2017.csv',
+            chest_xray_dir / 'images'
+        ]
+
+    @cached_report('_chest_xray_inputs')
     def validate_chest_xray(self) -> Dict:
         """
         Validate NIH ChestX-ray14 dataset
@@ -75,26 +282,52 @@ class DatasetValidator:
         bbox_path = chest_xray_dir / 'BBox_List_2017.csv'
 
         if metadata_path.exists():
-            df = pd.read_csv(metadata_path)
-            report['total_records'] = len(df)
-
-            # Disease distribution
-            all_labels = []
-            for labels_str in df['Finding Labels']:
-                labels = labels_str.split('|')
-                all_labels.extend(labels)
-
-            label_counts = Counter(all_labels)
+            # Only the label column is needed
+            if pa is not None:
+                # Multi-threaded parse into Arrow memory
+                table = pacsv.read_csv(
+                    metadata_path,
+                    read_options=pacsv.ReadOptions(use_threads=True, block_size=8 << 20),
+                    convert_options=pacsv.ConvertOptions(include_columns=['Finding Labels'])
+                )
+                report['total_records'] = table.num_rows
+
+                combination_counts = pc.value_counts(table.column('Finding Labels'))
+                combinations = zip(
+                    combination_counts.field('values').to_pylist(),
+                    combination_counts.field('counts').to_pylist()
+                )
+            else:
+                df = pd.read_csv(metadata_path, usecols=['Finding Labels'])
+                report['total_records'] = len(df)
+
+                combinations = df['Finding Labels'].value_counts().items()
+
+            # Disease distribution. Rows repeat a few thousand label
+            # combinations at most, so rows are counted per combination in
+            # native code and only the distinct combinations are split
+            label_counts = Counter()
+            for labels, count in combinations:
+                for label in labels.split('|'):
+                    label_counts[label] += int(count)
             report['label_distribution'] = dict(label_counts)
 
-            logger.info(f"Metadata: {len(df)} records")
+            logger.info(f"Metadata: {report['total_records']} records")
         else:
             report['errors'].append("Data_Entry_2017.csv not found")
 
         if bbox_path.exists():
-            bbox_df = pd.read_csv(bbox_path)
-            report['bounding_boxes'] = len(bbox_df)
-            logger.info(f"Bounding boxes: {len(bbox_df)} annotations")
+            if pa is not None:
+                # Only the row count is needed, so stream batches without
+                # building a table
+                reader = pacsv.open_csv(
+                    bbox_path,
+                    convert_options=pacsv.ConvertOptions(include_columns=['Image Index'])
+                )
+                report['bounding_boxes'] = sum(batch.num_rows for batch in reader)
+            else:
+                report['bounding_boxes'] = len(pd.read_csv(bbox_path, usecols=['Image Index']))
+            logger.info(f"Bounding boxes: {report['bounding_boxes']} annotations")
         else:
             report['warnings'].append("BBox_List_2017.csv not found")
 
@@ -102,12 +335,18 @@ class DatasetValidator:
         images_dir = chest_xray_dir / 'images'
 
         if images_dir.exists():
-            image_files = list(images_dir.glob('*.png'))
+            # File type comes from the directory listing itself, so filtering
+            # costs no extra syscalls
+            with os.scandir(images_dir) as entries:
+                image_files = [
+                    entry for entry in entries
+                    if entry.name.endswith('.png') and entry.is_file()
+                ]
             report['image_count'] = len(image_files)
 
             if image_files:
                 # Calculate total size
-                total_size = sum(f.stat().st_size for f in image_files)
+                total_size = sum(_parallel_map(_file_size, image_files))
                 report['total_size_gb'] = round(total_size / (1024**3), 2)
 
                 logger.info(f"Images: {len(image_files)} files ({report['total_size_gb']} GB)")
@@ -126,6 +365,20 @@ class DatasetValidator:
 
         return report
 
+    def _ct_segmentation_inputs(self) -> List[Path]:
+        """Directories validate_ct_segmentation lists, down to each KiTS19 case and Decathlon subset"""
+        ct_dir = self.data_dir / 'raw' / 'ct-segmentation'
+        kits_data_dir = ct_dir / 'kits19' / 'kits19' / 'data'
+        decathlon_dir = ct_dir / 'decathlon'
+
+        inputs = [ct_dir, ct_dir / 'kits19', kits_data_dir.parent, kits_data_dir, decathlon_dir, ct_dir / 'chaos']
+        inputs += [kits_data_dir / name for name, is_dir, _ in self._listdir(kits_data_dir) if is_dir]
+        for name, is_dir, _ in self._listdir(decathlon_dir):
+            if is_dir:
+                inputs += [decathlon_dir / name, decathlon_dir / name / 'imagesTr', decathlon_dir / name / 'labelsTr']
+        return inputs
+
+    @cached_report('_ct_segmentation_inputs')
     def validate_ct_segmentation(self) -> Dict:
         """
         Validate CT segmentation datasets
@@ -150,13 +403,19 @@ class DatasetValidator:
             'datasets': {}
         }
 
+        # One listing answers which datasets are present
+        datasets = self._children(ct_dir)
+
         # Check KiTS19
         kits_dir = ct_dir / 'kits19'
-        if kits_dir.exists():
+        if 'kits19' in datasets:
             kits_data_dir = kits_dir / 'kits19' / 'data'
 
-            if kits_data_dir.exists():
-                case_dirs = [d for d in kits_data_dir.iterdir() if d.is_dir() and d.name.startswith('case_')]
+            if 'data' in self._children(kits_dir / 'kits19'):
+                case_dirs = [
+                    kits_data_dir / name for name, is_dir, _ in self._listdir(kits_data_dir)
+                    if is_dir and name.startswith('case_')
+                ]
 
                 kits_report = {
                     'status': 'found',
@@ -164,11 +423,8 @@ class DatasetValidator:
                 }
 
                 # Check for imaging and segmentation files
-                valid_cases = 0
-                for case_dir in case_dirs:
-                    if (case_dir / 'imaging.nii.gz').exists() and \
-                       (case_dir / 'segmentation.nii.gz').exists():
-                        valid_cases += 1
+                # Each check is a whole directory read, so a pool pays off sooner
+                valid_cases = sum(_parallel_map(_kits_case_complete, case_dirs, threshold=8))
 
                 kits_report['valid_cases'] = valid_cases
                 kits_report['status'] = 'valid' if valid_cases == len(case_dirs) else 'incomplete'
@@ -183,32 +439,43 @@ class DatasetValidator:
 
         # Check Medical Segmentation Decathlon
         decathlon_dir = ct_dir / 'decathlon'
-        if decathlon_dir.exists():
-            tasks = [d for d in decathlon_dir.iterdir() if d.is_dir() and d.name.startswith('Task')]
+        if 'decathlon' in datasets:
+            # One pruned walk over decathlon/Task*/{imagesTr,labelsTr}/*.nii.gz,
+            # collecting {task: {subset: file count}}
+            task_counts = {}
+            for dirpath, dirnames, filenames in _walk_limited(decathlon_dir, max_depth=2):
+                relative_path = os.path.relpath(dirpath, decathlon_dir)
+
+                if relative_path == '.':
+                    dirnames[:] = [name for name in dirnames if name.startswith('Task')]
+                    task_counts = {name: {} for name in dirnames}
+                elif os.sep not in relative_path:
+                    dirnames[:] = [name for name in dirnames if name in ('imagesTr', 'labelsTr')]
+                else:
+                    task_name, subset = relative_path.split(os.sep)
+                    task_counts[task_name][subset] = sum(1 for name in filenames if name.endswith('.nii.gz'))
 
             decathlon_report = {
                 'status': 'found',
-                'task_count': len(tasks),
+                'task_count': len(task_counts),
                 'tasks': {}
             }
 
-            for task_dir in tasks:
-                task_name = task_dir.name
-
-                images_dir = task_dir / 'imagesTr'
-                labels_dir = task_dir / 'labelsTr'
+            for task_name, counts in task_counts.items():
+                # Tasks without imagesTr are skipped
+                if 'imagesTr' not in counts:
+                    continue
 
-                if images_dir.exists():
-                    image_count = len(list(images_dir.glob('*.nii.gz')))
-                    label_count = len(list(labels_dir.glob('*.nii.gz'))) if labels_dir.exists() else 0
+                image_count = counts['imagesTr']
+                label_count = counts.get('labelsTr', 0)
 
-                    decathlon_report['tasks'][task_name] = {
-                        'images': image_count,
-                        'labels': label_count,
-                        'status': 'valid' if image_count > 0 else 'empty'
-                    }
+                decathlon_report['tasks'][task_name] = {
+                    'images': image_count,
+                    'labels': label_count,
+                    'status': 'valid' if image_count > 0 else 'empty'
+                }
 
-                    logger.info(f"{task_name}: {image_count} images, {label_count} labels")
+                logger.info(f"{task_name}: {image_count} images, {label_count} labels")
 
             report['datasets']['decathlon'] = decathlon_report
         else:
@@ -216,14 +483,13 @@ class DatasetValidator:
 
         # Check CHAOS
         chaos_dir = ct_dir / 'chaos'
-        if chaos_dir.exists():
-            train_sets = chaos_dir / 'Train_Sets'
-            test_sets = chaos_dir / 'Test_Sets'
+        if 'chaos' in datasets:
+            chaos_sets = self._children(chaos_dir)
 
             chaos_report = {
                 'status': 'found',
-                'has_train': train_sets.exists(),
-                'has_test': test_sets.exists()
+                'has_train': 'Train_Sets' in chaos_sets,
+                'has_test': 'Test_Sets' in chaos_sets
             }
 
             report['datasets']['chaos'] = chaos_report
@@ -232,6 +498,34 @@ class DatasetValidator:
 
         return report
 
+    def _count_processed_samples(self, split_dir: Path) -> int:
+        """Number of processed images in a split directory"""
+        # index.csv holds one unquoted line per image, so count line breaks in
+        # large blocks rather than parsing it
+        line_count = 0
+        try:
+            with open(split_dir / 'index.csv', 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    line_count += block.count(b'\n')
+        except FileNotFoundError:
+            return 0
+
+        # Header line
+        return max(line_count - 1, 0)
+
+    def _processed_inputs(self) -> List[Path]:
+        """Files and directories validate_processed reads"""
+        chest_xray_processed = self.data_dir / 'processed' / 'chest-xray'
+        return [
+            chest_xray_processed.parent,
+            chest_xray_processed,
+            chest_xray_processed / 'train' / 'index.csv',
+            chest_xray_processed / 'val' / 'index.csv',
+            chest_xray_processed / 'test' / 'index.csv',
+            chest_xray_processed / 'preprocessing_config.json'
+        ]
+
+    @cached_report('_processed_inputs')
     def validate_processed(self) -> Dict:
         """
         Validate processed datasets
@@ -254,23 +548,25 @@ class DatasetValidator:
 
         # Check chest-xray processed
         chest_xray_processed = processed_dir / 'chest-xray'
-        if chest_xray_processed.exists():
-            train_dir = chest_xray_processed / 'train'
-            val_dir = chest_xray_processed / 'val'
-            test_dir = chest_xray_processed / 'test'
+        if 'chest-xray' in self._children(processed_dir):
+            # One listing answers which splits and files are present
+            contents = self._children(chest_xray_processed)
 
+            # Each split is one images.npy array; index.csv lists its filled rows
             chest_report = {
-                'train_samples': len(list(train_dir.glob('*.npy'))) if train_dir.exists() else 0,
-                'val_samples': len(list(val_dir.glob('*.npy'))) if val_dir.exists() else 0,
-                'test_samples': len(list(test_dir.glob('*.npy'))) if test_dir.exists() else 0
+                f'{split}_samples': self._count_processed_samples(chest_xray_processed / split) if split in contents else 0
+                for split in ('train', 'val', 'test')
             }
 
             # Load config if exists
             config_path = chest_xray_processed / 'preprocessing_config.json'
-            if config_path.exists():
-                with open(config_path) as f:
-                    config = json.load(f)
-                    chest_report['config'] = config
+            if 'preprocessing_config.json' in contents:
+                if orjson is not None:
+                    config = orjson.loads(config_path.read_bytes())
+                else:
+                    with open(config_path) as f:
+                        config = json.load(f)
+                chest_report['config'] = config
 
             report['datasets']['chest-xray'] = chest_report
             logger.info(f"Chest X-ray processed: train={chest_report['train_samples']}, "
@@ -287,18 +583,33 @@ class DatasetValidator:
         """
         logger.info("Generating validation report...")
 
+        # Listings from a previous report may be stale
+        self._dir_cache = {}
+
+        # The validators read disjoint directories and mostly wait on
+        # filesystem metadata, so run them side by side; the cache is opened
+        # up front so the threads share one handle
+        self.report_cache
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            chest_xray = executor.submit(self.validate_chest_xray)
+            ct_segmentation = executor.submit(self.validate_ct_segmentation)
+            processed = executor.submit(self.validate_processed)
+
         report = {
             'data_directory': str(self.data_dir),
             'raw_datasets': {
-                'chest-xray': self.validate_chest_xray(),
-                'ct-segmentation': self.validate_ct_segmentation()
+                'chest-xray': chest_xray.result(),
+                'ct-segmentation': ct_segmentation.result()
             },
-            'processed_datasets': self.validate_processed()
+            'processed_datasets': processed.result()
         }
 
         # Save report
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        else:
+            payload = json.dumps(report, indent=2).encode()
+        _write_file(output_path, payload)
 
         logger.info(f"Report saved to: {output_path}")
 
@@ -360,11 +671,25 @@ def main():
         default='dataset_validation_report.json',
         help='Output report file'
     )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='Reuse sub-reports from earlier runs while their inputs are unchanged'
+    )
+    parser.add_argument(
+        '--cache_dir',
+        type=str,
+        default='~/.cache/validate_datasets',
+        help='Directory caching sub-reports across runs (with --cache)'
+    )
 
     args = parser.parse_args()
 
     # Create validator
-    validator = DatasetValidator(data_dir=args.data_dir)
+    validator = DatasetValidator(
+        data_dir=args.data_dir,
+        cache_dir=args.cache_dir if args.cache else None
+    )
 
     # Generate report
     validator.generate_report(output_path=args.output)